@@ -12,8 +12,18 @@ Usage:
     python generate_pulse.py <vector_db_path>
 
 The script outputs a JSON array of objects to STDOUT.  Each object
-contains an ``id`` and a ``summary``.  The summary is the first
-200 characters of the document content with newlines collapsed.
+contains an ``id``, a ``score`` and a ``summary``.  The summary is an
+extractive summary of at most 200 characters: the document is split into
+sentences, every sentence of every selected document is scored in one
+sparse transform with the stored TF‑IDF vectorizer, and the sentences
+most similar to their document are kept in their original order.
+
+Documents are ranked in a single vectorised pass over the stored
+TF‑IDF matrix.  Each document is scored by recency, centrality
+(cosine similarity to the corpus centroid) and novelty (mean IDF of
+its terms), and near-duplicates are suppressed with a maximal marginal
+relevance (MMR) step.  The resulting ranking is cached next to the
+vector database and reused until the database version changes.
 
 The Node.js API server will invoke this script to generate the pulse
 data on demand.
@@ -21,8 +31,270 @@ data on demand.
 
 import json
 import os
+import re
 import sys
 import pickle
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# numpy is imported on first use so that the usage and error paths, which
+# the Node.js server may hit on every request, do not pay for loading it.
+# ``np`` is bound by ``_load_numpy``, which every scoring entry point calls.
+np = None
+
+PULSE_SIZE = 10
+
+# Character budget for each pulse summary.
+SUMMARY_BUDGET = 200
+
+# Relative weights of the ranking signals.  They sum to one so the
+# combined score stays in [0, 1].
+RECENCY_WEIGHT = 0.4
+CENTRALITY_WEIGHT = 0.4
+NOVELTY_WEIGHT = 0.2
+
+# Trade-off between relevance and diversity in the MMR step, and the
+# cosine similarity above which a candidate is treated as a duplicate.
+MMR_LAMBDA = 0.7
+DUPLICATE_THRESHOLD = 0.9
+
+# How many top-scored documents are considered by the MMR step.
+CANDIDATE_POOL_FACTOR = 5
+
+DATE_PATTERN = re.compile(r'Date:\s*(\d{4}-\d{2}-\d{2})')
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n+')
+
+
+def _document_timestamp(doc):
+    """Return a POSIX timestamp for a document, or None if unknown."""
+    value = doc.get('published') or doc.get('date')
+    if not value:
+        match = DATE_PATTERN.search(str(doc.get('content', '')))
+        value = match.group(1) if match else None
+    if not value:
+        return None
+    value = str(value).strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        # RSS ``pubDate`` values use RFC 2822, e.g. "Mon, 06 May 2024 10:00:00 GMT".
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        # Feeds without an offset are taken as UTC, not the server's zone.
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _load_numpy():
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+
+def _min_max(values):
+    """Scale an array to [0, 1]; constant arrays map to zeros."""
+    values = np.asarray(values, dtype=np.float64)
+    if values.size == 0:
+        return values
+    low, high = values.min(), values.max()
+    if high - low <= 0:
+        return np.zeros_like(values)
+    return (values - low) / (high - low)
+
+
+def recency_scores(docs):
+    """Score documents by date, falling back to insertion order."""
+    _load_numpy()
+    n = len(docs)
+    order = np.arange(n, dtype=np.float64)
+    stamps = np.array([_document_timestamp(doc) or np.nan for doc in docs], dtype=np.float64)
+    known = ~np.isnan(stamps)
+    if not known.any():
+        return _min_max(order)
+    # Dated documents score in [0.1, 1] by date with insertion order breaking
+    # ties; undated ones stay below 0.1 so they never outrank a dated one.
+    scores = np.empty(n, dtype=np.float64)
+    dated = 0.9 * _min_max(stamps[known]) + 0.1 * _min_max(order[known])
+    scores[known] = 0.1 + 0.9 * dated
+    scores[~known] = 0.09 * _min_max(order[~known])
+    return scores
+
+
+def centrality_scores(X):
+    """Cosine similarity of each row of ``X`` to the corpus centroid."""
+    _load_numpy()
+    centroid = np.asarray(X.mean(axis=0)).ravel()
+    norm = np.linalg.norm(centroid)
+    if norm == 0:
+        return np.zeros(X.shape[0])
+    row_norms = np.sqrt(np.asarray(X.multiply(X).sum(axis=1)).ravel())
+    row_norms[row_norms == 0] = 1.0
+    return np.asarray(X @ (centroid / norm)).ravel() / row_norms
+
+
+def novelty_scores(X, idf=None):
+    """Mean IDF of the terms present in each row of ``X``."""
+    _load_numpy()
+    presence = X.copy().tocsr()
+    presence.data = np.ones_like(presence.data)
+    if idf is None:
+        # Derive IDF from the matrix itself when no vectorizer is stored.
+        df = np.asarray(presence.sum(axis=0)).ravel()
+        idf = np.log((1 + X.shape[0]) / (1 + df)) + 1
+    term_counts = np.diff(presence.indptr).astype(np.float64)
+    term_counts[term_counts == 0] = 1.0
+    return _min_max(np.asarray(presence @ idf).ravel() / term_counts)
+
+
+def select_diverse(X, scores, limit, mmr_lambda=MMR_LAMBDA,
+                   duplicate_threshold=DUPLICATE_THRESHOLD):
+    """Greedy MMR selection over the highest scored documents.
+
+    Only the top ``limit * CANDIDATE_POOL_FACTOR`` documents are compared
+    pairwise, so the dense similarity block stays small regardless of
+    the size of the corpus.
+    """
+    _load_numpy()
+    pool_size = min(len(scores), limit * CANDIDATE_POOL_FACTOR)
+    pool = np.argsort(-scores, kind='stable')[:pool_size]
+    if pool_size == 0:
+        return []
+    rows = X[pool]
+    row_norms = np.sqrt(np.asarray(rows.multiply(rows).sum(axis=1)).ravel())
+    row_norms[row_norms == 0] = 1.0
+    similarity = (rows @ rows.T).toarray() / np.outer(row_norms, row_norms)
+
+    selected = []
+    max_similarity = np.zeros(pool_size)
+    available = np.ones(pool_size, dtype=bool)
+    pool_scores = scores[pool]
+    while len(selected) < limit and available.any():
+        mmr = mmr_lambda * pool_scores - (1 - mmr_lambda) * max_similarity
+        mmr[~available] = -np.inf
+        best = int(np.argmax(mmr))
+        selected.append(int(pool[best]))
+        max_similarity = np.maximum(max_similarity, similarity[best])
+        available[best] = False
+        available &= max_similarity < duplicate_threshold
+    return selected
+
+
+def rank_documents(vector_db, limit=PULSE_SIZE):
+    """Return ``(index, score)`` pairs for the documents to show."""
+    _load_numpy()
+    docs = vector_db.get('documents', [])
+    X = vector_db.get('tfidf')
+    if X is None or X.shape[0] != len(docs):
+        # Without a usable matrix fall back to insertion order.
+        return [(i, 0.0) for i in range(min(limit, len(docs)))]
+    X = X.tocsr()
+    vectorizer = vector_db.get('vectorizer')
+    idf = getattr(vectorizer, 'idf_', None)
+    scores = (
+        RECENCY_WEIGHT * recency_scores(docs)
+        + CENTRALITY_WEIGHT * _min_max(centrality_scores(X))
+        + NOVELTY_WEIGHT * novelty_scores(X, idf)
+    )
+    return [(i, float(scores[i])) for i in select_diverse(X, scores, limit)]
+
+
+def _db_version(path, vector_db):
+    """Identify the vector database build used to key the ranking cache."""
+    version = vector_db.get('version')
+    if version:
+        return str(version)
+    stat = os.stat(path)
+    return f'{stat.st_mtime_ns}-{stat.st_size}'
+
+
+def cached_ranking(path, vector_db, limit=PULSE_SIZE):
+    """Rank documents, reusing the cached result for the same DB version."""
+    cache_path = path + '.pulse-cache.json'
+    version = _db_version(path, vector_db)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == version and cache.get('limit') == limit:
+            return [tuple(entry) for entry in cache['ranking']]
+    except (OSError, ValueError, KeyError):
+        pass
+    ranking = rank_documents(vector_db, limit)
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': version, 'limit': limit, 'ranking': ranking}, f)
+    except OSError:
+        # The cache is an optimisation only; a read-only location is fine.
+        pass
+    return ranking
+
+
+def _truncate(text, budget):
+    """Cut ``text`` to ``budget`` characters, counting the ellipsis."""
+    if len(text) <= budget:
+        return text
+    return text[:budget - 1] + '…'
+
+
+def split_sentences(content):
+    """Split a document into whitespace-normalised sentences."""
+    sentences = (' '.join(part.split()) for part in SENTENCE_BOUNDARY.split(str(content)))
+    return [sentence for sentence in sentences if sentence]
+
+
+def summarize_documents(vector_db, indices, budget=SUMMARY_BUDGET):
+    """Build extractive summaries for the documents at ``indices``.
+
+    Sentences of all documents are transformed together, and each one is
+    scored by its cosine similarity to the TF‑IDF row of its document.
+    The best sentences are then taken greedily within ``budget``, which
+    includes the trailing ellipsis of a shortened summary.
+    """
+    _load_numpy()
+    docs = vector_db.get('documents', [])
+    texts = [' '.join(str(docs[i].get('content', '')).split()) for i in indices]
+    vectorizer = vector_db.get('vectorizer')
+    X = vector_db.get('tfidf')
+    if vectorizer is None or X is None or not indices:
+        return [_truncate(text, budget) for text in texts]
+
+    sentences, owners = [], []
+    per_doc = []
+    for index in indices:
+        doc_sentences = split_sentences(docs[index].get('content', ''))
+        per_doc.append(range(len(sentences), len(sentences) + len(doc_sentences)))
+        sentences.extend(doc_sentences)
+        owners.extend([index] * len(doc_sentences))
+    if not sentences:
+        return [_truncate(text, budget) for text in texts]
+
+    S = vectorizer.transform(sentences)
+    scores = np.asarray(S.multiply(X.tocsr()[owners]).sum(axis=1)).ravel()
+
+    summaries = []
+    for text, sentence_range in zip(texts, per_doc):
+        if len(text) <= budget or not sentence_range:
+            summaries.append(_truncate(text, budget))
+            continue
+        ranked = sorted(sentence_range, key=lambda k: (-scores[k], k))
+        # The text is over budget, so the summary always ends in an ellipsis.
+        chosen, used = [], 0
+        for k in ranked:
+            cost = len(sentences[k]) + (1 if chosen else 0)
+            if used + cost <= budget - 1:
+                chosen.append(k)
+                used += cost
+        if not chosen:
+            # Even the best sentence exceeds the budget; cut it instead.
+            summaries.append(_truncate(sentences[ranked[0]], budget))
+            continue
+        summary = ' '.join(sentences[k] for k in sorted(chosen))
+        summaries.append(summary + ('…' if len(chosen) < len(sentence_range) else ''))
+    return summaries
 
 
 def main():
@@ -36,17 +308,13 @@ def main():
     with open(path, 'rb') as f:
         vector_db = pickle.load(f)
     docs = vector_db.get('documents', [])
-    # Limit to top 10 documents.  If there are fewer, use all.
-    top_docs = docs[:10]
+    ranking = cached_ranking(path, vector_db)
+    summaries = summarize_documents(vector_db, [index for index, _ in ranking])
     pulse = []
-    for doc in top_docs:
-        content = doc.get('content', '')
-        # Normalise whitespace and truncate
-        text = ' '.join(str(content).split())
-        summary = text[:200] + ('…' if len(text) > 200 else '')
-        pulse.append({'id': doc.get('id'), 'summary': summary})
+    for (index, score), summary in zip(ranking, summaries):
+        pulse.append({'id': docs[index].get('id'), 'score': round(score, 4), 'summary': summary})
     print(json.dumps(pulse, ensure_ascii=False))
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
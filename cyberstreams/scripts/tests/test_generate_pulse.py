@@ -0,0 +1,127 @@
+"""Tests for generate_pulse.py"""
+
+import os
+import pickle
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import generate_pulse  # noqa: E402
+
+pytest.importorskip('sklearn')
+from sklearn.feature_extraction.text import TfidfVectorizer  # noqa: E402
+
+DOCS = [
+    {'id': 'ransomware', 'published': '2024-05-08',
+     'content': 'Ransomware group encrypts hospital systems across the region.'},
+    {'id': 'ransomware-copy', 'published': '2024-05-08',
+     'content': 'Ransomware group encrypts hospital systems, across the region!'},
+    {'id': 'phishing', 'published': 'Mon, 06 May 2024 10:00:00 GMT',
+     'content': 'Phishing campaign impersonates tax authority with fake refunds.'},
+    {'id': 'firmware', 'published': '2024-05-01T08:00:00',
+     'content': 'Router firmware update fixes remote code execution flaw.'},
+    {'id': 'undated',
+     'content': 'Botnet operators rent access to compromised webcams.'},
+]
+
+
+def make_vector_db(docs=DOCS, version='v1'):
+    vectorizer = TfidfVectorizer(stop_words='english')
+    tfidf = vectorizer.fit_transform([doc['content'] for doc in docs])
+    return {'documents': docs, 'tfidf': tfidf, 'vectorizer': vectorizer, 'version': version}
+
+
+def test_document_timestamp_formats():
+    iso = generate_pulse._document_timestamp({'published': '2024-05-06T10:00:00Z'})
+    rfc = generate_pulse._document_timestamp({'published': 'Mon, 06 May 2024 10:00:00 GMT'})
+    naive = generate_pulse._document_timestamp({'date': '2024-05-06T10:00:00'})
+    assert iso == rfc == naive
+    assert generate_pulse._document_timestamp({'content': 'Date: 2024-05-06\nBody'}) is not None
+    assert generate_pulse._document_timestamp({'published': 'yesterday'}) is None
+
+
+def test_undated_documents_rank_below_dated():
+    scores = generate_pulse.recency_scores(DOCS)
+    dated = scores[:4]
+    assert scores[4] < dated.min()
+    assert scores[0] > scores[2] > scores[3]
+
+
+def test_near_duplicates_are_not_both_selected():
+    vector_db = make_vector_db()
+    scores = generate_pulse.recency_scores(DOCS)
+    selected = generate_pulse.select_diverse(vector_db['tfidf'].tocsr(), scores, limit=5)
+    # Both copies are in the candidate pool but only one is shown.
+    assert len({0, 1} & set(selected)) == 1
+    assert {2, 3, 4} <= set(selected)
+
+
+def test_rank_documents_without_matrix_falls_back_to_order():
+    ranking = generate_pulse.rank_documents({'documents': DOCS}, limit=3)
+    assert ranking == [(0, 0.0), (1, 0.0), (2, 0.0)]
+
+
+def test_cached_ranking_reused_until_rebuild(tmp_path, monkeypatch):
+    path = str(tmp_path / 'vector_db.pkl')
+    vector_db = make_vector_db()
+    with open(path, 'wb') as f:
+        pickle.dump(vector_db, f)
+
+    calls = []
+    rank_documents = generate_pulse.rank_documents
+    monkeypatch.setattr(generate_pulse, 'rank_documents',
+                        lambda *args: calls.append(1) or rank_documents(*args))
+
+    first = generate_pulse.cached_ranking(path, vector_db)
+    second = generate_pulse.cached_ranking(path, vector_db)
+    assert first == second
+    assert len(calls) == 1
+    assert os.path.exists(path + '.pulse-cache.json')
+
+    rebuilt = make_vector_db(DOCS[2:], version='v2')
+    third = generate_pulse.cached_ranking(path, rebuilt)
+    assert len(calls) == 2
+    assert all(index < 3 for index, _ in third)
+
+
+LONG_DOC = {
+    'id': 'long',
+    'content': (
+        'Weather was mild this week. '
+        'Ransomware group encrypts hospital systems across the region. '
+        'Officials met for lunch downtown. '
+        'The ransomware group demands payment before hospital systems return. '
+        'Traffic was heavy on the bridge. '
+        'Hospital systems remain offline while the ransomware group negotiates.'
+    ),
+}
+
+
+def test_summary_within_budget_and_in_order():
+    docs = DOCS + [LONG_DOC]
+    vector_db = make_vector_db(docs)
+    budget = 140
+    [summary] = generate_pulse.summarize_documents(vector_db, [len(docs) - 1], budget=budget)
+    assert len(LONG_DOC['content']) > budget
+    assert len(summary) <= budget
+    assert summary.endswith('…')
+    kept = generate_pulse.split_sentences(summary.rstrip('…'))
+    sentences = generate_pulse.split_sentences(LONG_DOC['content'])
+    assert all(sentence in sentences for sentence in kept)
+    assert [sentences.index(sentence) for sentence in kept] == sorted(sentences.index(s) for s in kept)
+    assert any('ransomware' in sentence.lower() for sentence in kept)
+
+
+def test_short_documents_are_kept_whole():
+    vector_db = make_vector_db()
+    summaries = generate_pulse.summarize_documents(vector_db, [0, 2])
+    assert summaries == [DOCS[0]['content'], DOCS[2]['content']]
+
+
+def test_summary_without_vectorizer_truncates():
+    vector_db = {'documents': [LONG_DOC]}
+    [summary] = generate_pulse.summarize_documents(vector_db, [0], budget=50)
+    assert len(summary) == 50
+    assert summary == LONG_DOC['content'][:49] + '…'
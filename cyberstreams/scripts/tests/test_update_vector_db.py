@@ -0,0 +1,127 @@
+"""Tests for update_vector_db.py"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import update_vector_db  # noqa: E402
+
+
+ARRAY = [
+    1.5, -0.25, 1e-3, 2.5E+10, 12345, 0, -7, True, False, None,
+    "text with ] and , inside", {"id": "a", "content": "x", "score": 3.75},
+    [1, [2.0, "3"]], 6.02e23,
+]
+
+
+@pytest.fixture
+def array_file(tmp_path):
+    path = tmp_path / 'items.json'
+    path.write_text(' [ ' + ' ,\n '.join(json.dumps(item) for item in ARRAY) + ' ] ', encoding='utf-8')
+    return path
+
+
+@pytest.mark.parametrize('block_size', [1, 2, 3, 4, 7, 16, 1 << 20])
+def test_iter_json_array_matches_json_load(array_file, block_size):
+    with open(array_file, encoding='utf-8') as f:
+        expected = json.load(f)
+    assert list(update_vector_db.iter_json_array(str(array_file), block_size=block_size)) == expected
+
+
+def test_iter_json_array_rejects_malformed(tmp_path):
+    path = tmp_path / 'bad.json'
+    path.write_text('[1, {"a": ', encoding='utf-8')
+    with pytest.raises(ValueError):
+        list(update_vector_db.iter_json_array(str(path), block_size=3))
+
+
+def test_exact_copies_hashed_once(tmp_path):
+    items = [
+        {'id': 'a', 'content': 'Critical vulnerability in example router firmware', 'source': 'feed-1'},
+        {'id': 'b', 'content': 'Phishing campaign targets regional banks', 'source': 'feed-1'},
+        {'id': 'c', 'content': 'Critical  vulnerability in EXAMPLE router firmware', 'source': 'feed-2'},
+    ]
+    vector_db, stats = update_vector_db.build_vector_db(items, str(tmp_path / 'sig'))
+    assert stats == {'documents': 3, 'duplicates': 1, 'hashed': 2}
+    assert [doc['id'] for doc in vector_db['documents']] == ['a', 'b']
+    assert vector_db['documents'][0]['sources'] == ['feed-1', 'feed-2']
+
+    _, stats = update_vector_db.build_vector_db(items, str(tmp_path / 'sig'))
+    assert stats['hashed'] == 0
+
+
+ADVISORY = (
+    'A critical vulnerability in the example router firmware allows remote attackers '
+    'to execute arbitrary code through a crafted HTTP request to the management '
+    'interface. Administrators should apply the vendor patch immediately and restrict '
+    'access to the management interface from untrusted networks until the update is '
+    'installed on every affected device in the fleet.'
+)
+
+
+def test_cluster_duplicates_groups_similar_signatures():
+    import numpy as np
+    permutations = update_vector_db._permutations()
+    texts = [
+        ADVISORY,
+        'Phishing campaign impersonates the national tax authority and lures victims '
+        'to a fake refund portal that harvests banking credentials and one time codes.',
+        ADVISORY.replace('immediately', 'promptly'),
+    ]
+    signatures = np.vstack([update_vector_db.minhash_signature(text, permutations) for text in texts])
+    assert update_vector_db.cluster_duplicates(signatures) == [[0, 2], [1]]
+
+
+def test_near_duplicates_collapsed_with_merged_sources(tmp_path):
+    items = [
+        {'id': 'a', 'content': ADVISORY, 'source': 'feed-1', 'pubDate': 'Mon, 06 May 2024 10:00:00 GMT'},
+        {'id': 'b', 'content': 'Phishing campaign impersonates the national tax authority.',
+         'source': 'feed-1', 'publishedAt': '2024-05-07T09:00:00Z'},
+        {'id': 'c', 'content': ADVISORY.replace('immediately', 'promptly').replace('fleet', 'network'),
+         'source': 'feed-2'},
+    ]
+    vector_db, stats = update_vector_db.build_vector_db(items, str(tmp_path / 'sig'))
+    assert stats == {'documents': 3, 'duplicates': 1, 'hashed': 3}
+    documents = {doc['id']: doc for doc in vector_db['documents']}
+    assert set(documents) == {'a', 'b'}
+    assert documents['a']['sources'] == ['feed-1', 'feed-2']
+    assert documents['a']['duplicates'] == 1
+    assert documents['a']['published'] == 'Mon, 06 May 2024 10:00:00 GMT'
+    assert documents['b']['published'] == '2024-05-07T09:00:00Z'
+
+
+CORPUS = [
+    f"Advisory {i}: {topic} affecting {product} was reported by {team}."
+    for i, (topic, product, team) in enumerate(
+        (topic, product, team)
+        for topic in ('ransomware', 'phishing', 'credential stuffing', 'supply chain compromise')
+        for product in ('routers', 'mail servers', 'VPN gateways')
+        for team in ('CERT-EU', 'CISA', 'a vendor')
+    )
+]
+
+
+def test_matches_tfidf_vectorizer(tmp_path):
+    vector_db, stats = update_vector_db.build_vector_db(CORPUS, str(tmp_path / 'sig'), chunk_size=5)
+    assert stats['duplicates'] == 0
+    expected_vectorizer = update_vector_db.make_vectorizer()
+    expected = expected_vectorizer.fit_transform(CORPUS)
+    assert vector_db['vectorizer'].vocabulary_ == expected_vectorizer.vocabulary_
+    assert abs(vector_db['tfidf'] - expected).max() < 1e-12
+    assert abs(vector_db['vectorizer'].transform(CORPUS[:3]) - expected[:3]).max() < 1e-12
+
+
+def test_worker_processes_match_serial_build(tmp_path):
+    items = CORPUS + [CORPUS[3].upper(), CORPUS[7]]
+    serial, serial_stats = update_vector_db.build_vector_db(items, str(tmp_path / 'serial'), chunk_size=5)
+    parallel, parallel_stats = update_vector_db.build_vector_db(
+        items, str(tmp_path / 'parallel'), workers=3, chunk_size=5,
+    )
+    assert serial_stats == parallel_stats
+    assert serial['documents'] == parallel['documents']
+    assert serial['vectorizer'].vocabulary_ == parallel['vectorizer'].vocabulary_
+    assert abs(serial['tfidf'] - parallel['tfidf']).max() == 0
@@ -6,8 +6,28 @@ database used by the Cyberstreams platform.  It reads a JSON file containing
 an array of textual documents, computes a TF‑IDF matrix using scikit‑learn,
 and serialises the resulting vectorizer and matrix alongside metadata.
 
+Each input item is either a string or an object with ``content`` (or
+``text``) and optional ``id``, ``source``/``url`` and publication date
+(``published``, ``date``, ``pubDate`` or ``publishedAt``) fields.  The date
+is kept on the stored document so that generate_pulse.py can rank by
+recency.
+
+Before indexing, near-duplicates (for example the same advisory syndicated
+by several feeds) are clustered with MinHash signatures and LSH banding.
+Only the first document of each cluster is indexed; it records the sources
+of every copy in its ``sources`` list.  Signatures are persisted next to
+the vector database and keyed by content digest, so later runs only hash
+documents they have not seen before.
+
+The input is streamed and processed in chunks.  Each chunk is tokenized,
+counted and MinHashed by a worker process; the parent merges the per-chunk
+vocabularies and assembles the CSR count matrix directly, so the raw JSON
+is never held in memory in full and build time scales with ``--workers``.
+The resulting matrix and vectorizer are identical to those produced by
+``TfidfVectorizer.fit_transform`` on the deduplicated documents.
+
 Usage:
-    python update_vector_db.py path/to/scraped_texts.json
+    python update_vector_db.py path/to/scraped_texts.json [--workers N] [--chunk-size N]
 
 Requires:
     - scikit‑learn installed in the Python environment
@@ -16,37 +36,454 @@ Requires:
 The output is written to ../vector_db.pkl relative to this script.
 """
 
+import argparse
+import hashlib
 import json
 import os
+import re
 import sys
 import pickle
-from sklearn.feature_extraction.text import TfidfVectorizer
+import time
+import zlib
+from collections import deque
 
+# numpy, scipy and scikit-learn are imported on first use so that ``--help``
+# and argument errors do not pay for loading them.  ``np`` is bound by
+# ``_load_numpy``, which every entry point that needs numpy calls first.
+np = None
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python update_vector_db.py <input_json>")
-        sys.exit(1)
-    input_path = sys.argv[1]
-    with open(input_path, 'r', encoding='utf-8') as f:
-        texts = json.load(f)
-    # Ensure we have a list of strings
-    documents = [str(t) for t in texts if isinstance(t, str)]
-    if not documents:
-        print("No documents to index.")
+# MinHash / LSH parameters.  16 bands of 8 rows put the LSH threshold at
+# roughly (1/16) ** (1/8) ~= 0.71 estimated Jaccard similarity; candidate
+# pairs are then confirmed against DUPLICATE_JACCARD.
+NUM_PERM = 128
+LSH_BANDS = 16
+SHINGLE_SIZE = 3
+DUPLICATE_JACCARD = 0.8
+MINHASH_SEED = 1
+MERSENNE_PRIME = (1 << 31) - 1
+
+TOKEN_PATTERN = re.compile(r'\w+')
+SEPARATOR_PATTERN = re.compile(r'[\s,]*')
+# A top-level number is only complete once the next delimiter is visible;
+# ``1.`` at a block edge would otherwise decode as ``1``.
+NUMBER_END_PATTERN = re.compile(r'\s*[,\]]')
+
+# Publication date keys, in order of preference: our own, RSS (``pubDate``
+# from enhancedScraper.js) and the cron ingester (``publishedAt``).
+DATE_FIELDS = ('published', 'date', 'pubDate', 'publishedAt')
+
+DEFAULT_CHUNK_SIZE = 2000
+READ_BLOCK_SIZE = 1 << 20
+
+
+def _load_numpy():
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+    return np
+
+
+def _permutations(num_perm=NUM_PERM, seed=MINHASH_SEED):
+    """Deterministic ``(a, b)`` coefficients of the universal hash family."""
+    _load_numpy()
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+    b = rng.randint(0, MERSENNE_PRIME, size=num_perm).astype(np.uint64)
+    return a, b
+
+
+def make_vectorizer(vocabulary=None):
+    """The vectorizer configuration used for the vector database."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    return TfidfVectorizer(stop_words='english', vocabulary=vocabulary)
+
+
+def content_digest(text):
+    """Stable key for a document's normalised content."""
+    normalised = ' '.join(text.lower().split())
+    return hashlib.sha1(normalised.encode('utf-8')).hexdigest()
+
+
+def shingle_hashes(text, size=SHINGLE_SIZE):
+    """31-bit hashes of the word shingles of ``text``."""
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) < size:
+        shingles = {' '.join(tokens)}
+    else:
+        shingles = {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+    return np.fromiter(
+        (zlib.crc32(s.encode('utf-8')) & MERSENNE_PRIME for s in shingles),
+        dtype=np.uint64, count=len(shingles),
+    )
+
+
+def minhash_signature(text, permutations):
+    """MinHash signature of ``text`` as a ``uint32`` vector.
+
+    ``permutations`` comes from ``_permutations``, which loads numpy.
+    """
+    a, b = permutations
+    hashes = shingle_hashes(text)
+    values = (a[:, None] * hashes[None, :] + b[:, None]) % MERSENNE_PRIME
+    return values.min(axis=1).astype(np.uint32)
+
+
+def load_signatures(path):
+    """Load persisted signatures, discarding them if parameters changed."""
+    try:
+        with open(path, 'rb') as f:
+            store = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return {}
+    if store.get('num_perm') != NUM_PERM or store.get('seed') != MINHASH_SEED \
+            or store.get('shingle_size') != SHINGLE_SIZE:
+        return {}
+    return store.get('signatures', {})
+
+
+def save_signatures(path, signatures):
+    store = {
+        'num_perm': NUM_PERM,
+        'seed': MINHASH_SEED,
+        'shingle_size': SHINGLE_SIZE,
+        'signatures': signatures,
+    }
+    with open(path, 'wb') as f:
+        pickle.dump(store, f)
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def cluster_duplicates(signatures, bands=LSH_BANDS, threshold=DUPLICATE_JACCARD):
+    """Group near-duplicate signatures with LSH banding.
+
+    ``signatures`` is an ``(n, NUM_PERM)`` array.  Returns a list of
+    clusters, each a sorted list of row indices; clusters are ordered by
+    their first member.  Every document is bucketed once per band, so the
+    cost is linear in ``n`` plus the number of candidate pairs.
+    """
+    _load_numpy()
+    n = signatures.shape[0]
+    rows = signatures.shape[1] // bands
+    parent = list(range(n))
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows:(band + 1) * rows])
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows))).ravel()
+        _, inverse, sizes = np.unique(keys, return_inverse=True, return_counts=True)
+        # Only buckets holding more than one document yield candidate pairs.
+        shared = sizes[inverse.ravel()] > 1
+        members_sorted = np.flatnonzero(shared)
+        members_sorted = members_sorted[np.argsort(inverse.ravel()[shared], kind='stable')]
+        boundaries = np.cumsum(sizes[sizes > 1])[:-1]
+        for members in np.split(members_sorted, boundaries):
+            if len(members) < 2:
+                continue
+            members = members.tolist()
+            head = members[0]
+            for other in members[1:]:
+                root_head, root_other = _find(parent, head), _find(parent, other)
+                if root_head == root_other:
+                    continue
+                similarity = np.mean(signatures[head] == signatures[other])
+                if similarity >= threshold:
+                    parent[max(root_head, root_other)] = min(root_head, root_other)
+    clusters = {}
+    for i in range(n):
+        clusters.setdefault(_find(parent, i), []).append(i)
+    return [clusters[root] for root in sorted(clusters)]
+
+
+def iter_json_array(path, block_size=READ_BLOCK_SIZE):
+    """Yield the elements of a top-level JSON array without loading it whole."""
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = ''
+        while not buf:
+            block = f.read(block_size)
+            if not block:
+                break
+            buf = block.lstrip()
+        if not buf.startswith('['):
+            raise ValueError(f"{path} does not contain a JSON array")
+        pos = 1
+        eof = False
+        while True:
+            pos = SEPARATOR_PATTERN.match(buf, pos).end()
+            if pos < len(buf) and buf[pos] == ']':
+                return
+            end = None
+            if pos < len(buf):
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    pass
+            # An element ending exactly at the buffer edge may be truncated.
+            truncated = end is not None and not eof and (
+                end == len(buf)
+                or (isinstance(item, (int, float)) and not isinstance(item, bool)
+                    and not NUMBER_END_PATTERN.match(buf, end))
+            )
+            if end is None or truncated:
+                if eof:
+                    raise ValueError(f"Malformed JSON array in {path}")
+                block = f.read(block_size)
+                eof = not block
+                buf = buf[pos:] + block
+                pos = 0
+                continue
+            yield item
+            pos = end
+
+
+def normalise_items(items):
+    """Turn raw input items into ``{'id', 'content', 'source', 'published'}`` records."""
+    for item in items:
+        if isinstance(item, str):
+            content, doc_id, source, published = item, None, None, None
+        elif isinstance(item, dict):
+            content = item.get('content') or item.get('text')
+            doc_id = item.get('id')
+            source = item.get('source') or item.get('url')
+            published = next((item[key] for key in DATE_FIELDS if item.get(key)), None)
+        else:
+            continue
+        if not isinstance(content, str) or not content.strip():
+            continue
+        yield {'id': doc_id, 'content': content, 'source': source, 'published': published}
+
+
+def iter_chunks(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+_worker_state = {}
+
+
+def _init_worker():
+    _worker_state['analyzer'] = make_vectorizer().build_analyzer()
+    _worker_state['permutations'] = _permutations()
+
+
+def process_chunk(chunk):
+    """Tokenize, count and MinHash one chunk of ``(content, signature)`` pairs.
+
+    Signatures that are already known are passed through.  Pairs with no
+    content are exact copies of an earlier document; they get an empty row
+    and a placeholder signature that the caller fills in.  Term ids in the
+    returned counts refer to the chunk-local ``terms`` list.
+    """
+    if not _worker_state:
+        _init_worker()
+    analyzer = _worker_state['analyzer']
+    permutations = _worker_state['permutations']
+    vocabulary = {}
+    indptr = [0]
+    indices = []
+    counts = []
+    signatures = np.empty((len(chunk), NUM_PERM), dtype=np.uint32)
+    for row, (content, signature) in enumerate(chunk):
+        if content is None:
+            indptr.append(len(indices))
+            signatures[row] = 0
+            continue
+        doc_counts = {}
+        for token in analyzer(content):
+            term_id = vocabulary.setdefault(token, len(vocabulary))
+            doc_counts[term_id] = doc_counts.get(term_id, 0) + 1
+        indices.extend(doc_counts.keys())
+        counts.extend(doc_counts.values())
+        indptr.append(len(indices))
+        signatures[row] = signature if signature is not None \
+            else minhash_signature(content, permutations)
+    return {
+        'terms': list(vocabulary),
+        'indptr': np.asarray(indptr, dtype=np.int64),
+        'indices': np.asarray(indices, dtype=np.int64),
+        'counts': np.asarray(counts, dtype=np.int64),
+        'signatures': signatures,
+    }
+
+
+def _map_chunks(chunks, workers):
+    """Run ``process_chunk`` over ``chunks`` in order with bounded look-ahead."""
+    if workers <= 1:
+        for chunk in chunks:
+            yield process_chunk(chunk)
         return
-    vectorizer = TfidfVectorizer(stop_words='english')
-    X = vectorizer.fit_transform(documents)
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(process_chunk, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def build_vector_db(items, signature_path, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Deduplicate ``items`` and build the TF‑IDF vector database.
+
+    Returns ``(vector_db, stats)`` where ``stats`` reports the number of
+    input documents, collapsed duplicates and newly hashed signatures.
+    """
+    _load_numpy()
+    from scipy.sparse import csr_matrix
+    from sklearn.feature_extraction.text import TfidfTransformer
+    known = load_signatures(signature_path)
+    records = []
+    digests = []
+    # Exact copies are tokenized and hashed once; ``repeats`` maps each
+    # later copy to the row of the first one.
+    first_rows = {}
+    repeats = []
+    hashed = 0
+
+    def tasks():
+        nonlocal hashed
+        for chunk in iter_chunks(normalise_items(items), chunk_size):
+            task = []
+            for record in chunk:
+                digest = content_digest(record['content'])
+                row = len(records)
+                records.append(record)
+                digests.append(digest)
+                if digest in first_rows:
+                    repeats.append((row, first_rows[digest]))
+                    task.append((None, None))
+                    continue
+                first_rows[digest] = row
+                signature = known.get(digest)
+                hashed += signature is None
+                task.append((record['content'], signature))
+            yield task
+
+    vocabulary = {}
+    signature_blocks = []
+    index_blocks = []
+    count_blocks = []
+    indptr_blocks = [np.zeros(1, dtype=np.int64)]
+    nnz = 0
+    for result in _map_chunks(tasks(), workers):
+        local_to_global = np.fromiter(
+            (vocabulary.setdefault(term, len(vocabulary)) for term in result['terms']),
+            dtype=np.int64, count=len(result['terms']),
+        )
+        index_blocks.append(local_to_global[result['indices']])
+        count_blocks.append(result['counts'])
+        indptr_blocks.append(result['indptr'][1:] + nnz)
+        nnz += len(result['indices'])
+        signature_blocks.append(result['signatures'])
+
+    if not records:
+        return None, {'documents': 0, 'duplicates': 0, 'hashed': 0}
+
+    signatures = np.vstack(signature_blocks)
+    if repeats:
+        copies, originals = np.array(repeats, dtype=np.int64).T
+        signatures[copies] = signatures[originals]
+    try:
+        save_signatures(signature_path, dict(zip(digests, signatures)))
+    except OSError as e:
+        print(f"Could not persist MinHash signatures: {e}", file=sys.stderr)
+
+    counts = csr_matrix(
+        (np.concatenate(count_blocks), np.concatenate(index_blocks), np.concatenate(indptr_blocks)),
+        shape=(len(records), len(vocabulary)),
+    )
+    del index_blocks, count_blocks, indptr_blocks
+
+    clusters = cluster_duplicates(signatures)
+    keep = np.array([cluster[0] for cluster in clusters], dtype=np.int64)
+    counts = counts[keep]
+
+    # Match TfidfVectorizer: only terms of indexed documents, sorted.
+    df = np.bincount(counts.indices, minlength=counts.shape[1])
+    terms = sorted((term for term, i in vocabulary.items() if df[i] > 0))
+    remap = np.full(counts.shape[1], -1, dtype=np.int64)
+    remap[[vocabulary[term] for term in terms]] = np.arange(len(terms))
+    counts = csr_matrix((counts.data, remap[counts.indices], counts.indptr),
+                        shape=(counts.shape[0], len(terms)))
+    counts.sort_indices()
+
+    transformer = TfidfTransformer()
+    X = transformer.fit_transform(counts)
+    vectorizer = make_vectorizer({term: i for i, term in enumerate(terms)})
+    vectorizer.idf_ = transformer.idf_
+
+    documents = []
+    for position, cluster in enumerate(clusters):
+        canonical = records[cluster[0]]
+        sources = []
+        published = canonical['published']
+        for i in cluster:
+            source = records[i]['source']
+            if source and source not in sources:
+                sources.append(source)
+            # Fall back to a syndicated copy's date if the first lacks one
+            published = published or records[i]['published']
+        document = {
+            'id': canonical['id'] or f'doc-{position+1}',
+            'content': canonical['content'],
+            'sources': sources,
+            'duplicates': len(cluster) - 1,
+        }
+        if published:
+            document['published'] = published
+        documents.append(document)
+
     vector_db = {
-        'documents': [ {'id': f'doc-{i+1}', 'content': doc} for i, doc in enumerate(documents) ],
+        'documents': documents,
         'tfidf': X,
-        'vectorizer': vectorizer
+        'vectorizer': vectorizer,
+        # Changes on every rebuild so consumers can invalidate derived caches
+        'version': str(time.time_ns())
+    }
+    stats = {
+        'documents': len(records),
+        'duplicates': len(records) - len(documents),
+        'hashed': hashed,
     }
+    return vector_db, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Update the Cyberstreams vector database.")
+    parser.add_argument('input_json', help="JSON array of scraped documents")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes for tokenizing and hashing (default: 1)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"documents per worker task (default: {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args()
+
     out_path = os.path.join(os.path.dirname(__file__), '..', 'vector_db.pkl')
+    vector_db, stats = build_vector_db(
+        iter_json_array(args.input_json), out_path + '.minhash',
+        workers=args.workers, chunk_size=args.chunk_size,
+    )
+    if vector_db is None:
+        print("No documents to index.")
+        return
+    X = vector_db['tfidf']
     with open(out_path, 'wb') as f:
         pickle.dump(vector_db, f)
+    print(f"Collapsed {stats['duplicates']} near-duplicates "
+          f"({stats['hashed']} new MinHash signatures computed).")
     print(f"Vector database updated with {X.shape[0]} documents and {X.shape[1]} features. Saved to {out_path}")
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -14,6 +14,39 @@ Features:
 __version__ = "1.3.0"
 __author__ = "Cyberstreams"
 
-from .catalog import OsintCatalog, OsintTool
+# Submodules are imported on first attribute access (PEP 562) so that
+# ``import osint`` stays cheap for short-lived subprocesses.
+_LAZY_ATTRIBUTES = {
+    "OsintCatalog": ".catalog",
+    "OsintTool": ".catalog",
+}
 
 __all__ = ["OsintCatalog", "OsintTool", "__version__"]
+
+
+def _lazy_exports(namespace, attributes):
+    """
+    Build PEP 562 ``__getattr__``/``__dir__`` hooks for a package
+
+    ``attributes`` maps exported names to the relative submodule defining
+    them; the submodule is imported on first access and the value cached
+    in ``namespace`` (the package's ``globals()``).
+    """
+    package = namespace['__name__']
+
+    def __getattr__(name):
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        from importlib import import_module
+        value = getattr(import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(namespace.get('__all__', ())))
+
+    return __getattr__, __dir__
+
+
+__getattr__, __dir__ = _lazy_exports(globals(), _LAZY_ATTRIBUTES)
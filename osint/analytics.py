@@ -0,0 +1,177 @@
+"""
+OSINT Catalog Analytics
+
+Columnar (Apache Arrow / Parquet) export of the tool catalog and vectorized
+aggregations over it for dashboards.
+
+Category, risk level, verification status and tags are dictionary encoded
+and flags are stored as Arrow booleans (bit-packed), so exports are a
+fraction of the size of ``export_to_json`` and group-by queries run over
+integer codes instead of Python objects.  Requires ``pyarrow``.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # optional dependency, checked on use
+    pa = pc = None
+
+from .catalog import OsintTool, ToolCategory
+from .metrics import timed
+
+FLAG_COLUMNS = (
+    'requires_api_key', 'requires_install', 'docker_available', 'web_interface',
+    'is_whitelisted', 'requires_approval',
+)
+RISK_LEVELS = ('low', 'medium', 'high', 'critical')
+ANALYTICS_SECONDS = 'osint_analytics_seconds'
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow is required for columnar catalog analytics: pip install pyarrow")
+
+
+def _dictionary(values: List[Optional[str]], categories: Sequence[str]) -> 'pa.DictionaryArray':
+    """Dictionary-encode ``values`` with a stable, predeclared dictionary"""
+    dictionary = list(categories)
+    codes = {value: i for i, value in enumerate(dictionary)}
+    for value in values:
+        if value is not None and value not in codes:
+            codes[value] = len(dictionary)
+            dictionary.append(value)
+    index_type = pa.int8() if len(dictionary) < 128 else pa.int32()
+    indices = pa.array([codes.get(value) if value is not None else None for value in values], type=index_type)
+    return pa.DictionaryArray.from_arrays(indices, pa.array(dictionary, type=pa.string()))
+
+
+def tools_to_table(tools: Iterable[OsintTool]) -> 'pa.Table':
+    """Build an Arrow table with one row per tool"""
+    _require_pyarrow()
+    tools = list(tools)
+
+    offsets = [0]
+    flat_tags = []
+    for tool in tools:
+        flat_tags.extend(tool.tags or [])
+        offsets.append(len(flat_tags))
+    tag_values = _dictionary(flat_tags, sorted(set(flat_tags)))
+
+    columns = {
+        'name': pa.array([t.name for t in tools], type=pa.string()),
+        'url': pa.array([t.url for t in tools], type=pa.string()),
+        'description': pa.array([t.description for t in tools], type=pa.string()),
+        'category': _dictionary([t.category.value for t in tools], [c.value for c in ToolCategory]),
+        'tags': pa.ListArray.from_arrays(pa.array(offsets, type=pa.int32()), tag_values),
+        'author': pa.array([t.author for t in tools], type=pa.string()),
+        'license': pa.array([t.license for t in tools], type=pa.string()),
+        'language': pa.array([t.language for t in tools], type=pa.string()),
+        'risk_level': _dictionary([t.risk_level for t in tools], RISK_LEVELS),
+        'added_date': pa.array([t.added_date for t in tools], type=pa.string()),
+        'last_verified': pa.array([t.last_verified for t in tools], type=pa.string()),
+        'verification_status': _dictionary([t.verification_status for t in tools], []),
+        'popularity_score': pa.array([t.popularity_score for t in tools], type=pa.int32()),
+    }
+    for flag in FLAG_COLUMNS:
+        columns[flag] = pa.array([bool(getattr(t, flag)) for t in tools], type=pa.bool_())
+    return pa.table(columns)
+
+
+@timed(ANALYTICS_SECONDS, 'Columnar analytics operation latency', operation='export')
+def export_table(table: 'pa.Table', output_path: str, fmt: Optional[str] = None,
+                 compression: str = 'zstd') -> str:
+    """
+    Write ``table`` as Parquet or Arrow IPC (Feather v2)
+
+    The format follows the file extension (``.parquet`` or ``.arrow``/
+    ``.feather``) unless ``fmt`` is given.
+    """
+    _require_pyarrow()
+    path = Path(output_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fmt = fmt or ('parquet' if path.suffix == '.parquet' else 'arrow')
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+        # Parquet dictionary-encodes every column by default; the Arrow
+        # dictionary types are restored from the embedded schema on read.
+        pq.write_table(table, path, compression=compression)
+    else:
+        import pyarrow.feather as feather
+        feather.write_feather(table, path, compression=compression)
+    return str(path)
+
+
+def read_table(path: str) -> 'pa.Table':
+    """Load a table written by ``export_table``"""
+    _require_pyarrow()
+    if str(path).endswith('.parquet'):
+        import pyarrow.parquet as pq
+        return pq.read_table(path)
+    import pyarrow.feather as feather
+    return feather.read_table(path)
+
+
+def _filter(table: 'pa.Table', where: Optional[Dict[str, Any]]) -> 'pa.Table':
+    if not where:
+        return table
+    mask = None
+    for column, value in where.items():
+        condition = pc.equal(table[column], pa.scalar(value))
+        mask = condition if mask is None else pc.and_(mask, condition)
+    return table.filter(mask)
+
+
+@timed(ANALYTICS_SECONDS, 'Columnar analytics operation latency', operation='count_by')
+def count_by(table: 'pa.Table', by: Union[str, Sequence[str]],
+             where: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Count tools grouped by one or more columns
+
+    ``by`` may name the category, risk level, tags or any flag column;
+    grouping by ``tags`` counts each tag of a tool once.  ``where`` applies
+    equality filters first, e.g. ``{'is_whitelisted': True}``.  Returns rows
+    ``{<column>: value, ..., 'count': n}`` sorted by descending count.
+    """
+    _require_pyarrow()
+    keys = [by] if isinstance(by, str) else list(by)
+    table = _filter(table, where)
+    if 'tags' in keys:
+        # One row per (tool, tag): repeat the other key columns per tag
+        parents = pc.list_parent_indices(table['tags'])
+        exploded = {key: table[key].take(parents) for key in keys if key != 'tags'}
+        exploded['tags'] = pc.list_flatten(table['tags'])
+        table = pa.table(exploded)
+    grouped = table.select(keys).group_by(keys).aggregate([([], 'count_all')])
+    grouped = grouped.rename_columns(keys + ['count']).sort_by([('count', 'descending')])
+    return grouped.to_pylist()
+
+
+def _flag_total(table: 'pa.Table', flag: str) -> int:
+    return pc.sum(table[flag]).as_py() or 0
+
+
+def summarize(table: 'pa.Table') -> Dict[str, Any]:
+    """
+    Dashboard overview with the keys of ``OsintCatalog.get_statistics``
+
+    ``by_risk_level``, ``requires_api_key`` and ``requires_install`` are
+    added on top of that key set.
+    """
+    _require_pyarrow()
+    by_category = {c.value: 0 for c in ToolCategory}
+    by_category.update({row['category']: row['count'] for row in count_by(table, 'category')})
+    stats = {
+        'total_tools': table.num_rows,
+        'by_category': by_category,
+        'whitelisted': _flag_total(table, 'is_whitelisted'),
+        'requires_approval': _flag_total(table, 'requires_approval'),
+        'web_interface': _flag_total(table, 'web_interface'),
+        'docker_available': _flag_total(table, 'docker_available'),
+    }
+    stats['by_risk_level'] = {row['risk_level']: row['count'] for row in count_by(table, 'risk_level')}
+    stats['requires_api_key'] = _flag_total(table, 'requires_api_key')
+    stats['requires_install'] = _flag_total(table, 'requires_install')
+    return stats
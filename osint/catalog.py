@@ -5,13 +5,27 @@ Manages the registry of OSINT tools including metadata, categorization, and stor
 """
 
 import json
+import logging
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Hashable, Iterable, Tuple
 from enum import Enum
 
+from .metrics import count, timed
+
+logger = logging.getLogger(__name__)
+
+DB_SECONDS = 'osint_catalog_db_seconds'
+QUERY_SECONDS = 'osint_catalog_query_seconds'
+
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_CACHE_TTL = 300.0
+
 
 class ToolCategory(str, Enum):
     """OSINT Tool Categories"""
@@ -56,6 +70,7 @@ class OsintTool:
     added_date: Optional[str] = None
     last_verified: Optional[str] = None
     popularity_score: int = 0
+    verification_status: Optional[str] = None  # HTTP status code or error kind
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
@@ -71,14 +86,37 @@ class OsintTool:
 
 
 class OsintCatalog:
-    """Manages OSINT Tool Catalog"""
+    """Manages OSINT Tool Catalog
 
-    def __init__(self, db_path: str = "osint/registry/osint.db"):
+    Results of ``search``, ``get_by_category`` and ``get_statistics`` are kept
+    in a bounded LRU cache with a TTL.  Entries are tagged with a generation
+    counter that every mutation bumps; writes committed by other processes are
+    detected through SQLite's ``data_version`` and reload the tools before the
+    next query is answered.
+    """
+
+    def __init__(self, db_path: str = "osint/registry/osint.db",
+                 cache_size: int = DEFAULT_CACHE_SIZE, cache_ttl: float = DEFAULT_CACHE_TTL):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.tools: List[OsintTool] = []
         self._init_database()
 
+        # All reads and writes share one connection, so its data_version only
+        # changes when another connection commits.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._data_version = self._read_data_version()
+        self._loaded_from_db = False
+
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._generation = 0
+        self._cache: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+
     def _init_database(self):
         """Initialize SQLite database"""
         conn = sqlite3.connect(self.db_path)
@@ -104,10 +142,16 @@ class OsintCatalog:
                 requires_approval INTEGER DEFAULT 0,
                 added_date TEXT,
                 last_verified TEXT,
-                popularity_score INTEGER DEFAULT 0
+                popularity_score INTEGER DEFAULT 0,
+                verification_status TEXT
             )
         ''')
 
+        # Databases created before URL verification lack the status column
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(tools)')}
+        if 'verification_status' not in columns:
+            cursor.execute('ALTER TABLE tools ADD COLUMN verification_status TEXT')
+
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS snapshots (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -120,19 +164,100 @@ class OsintCatalog:
         conn.commit()
         conn.close()
 
+    def close(self):
+        """Close the catalog's SQLite connection"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> 'OsintCatalog':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _read_data_version(self) -> int:
+        return self._conn.execute('PRAGMA data_version').fetchone()[0]
+
+    def _bump_generation(self):
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+
+    def invalidate_cache(self):
+        """Drop cached query results (call after mutating ``tools`` directly)"""
+        self._bump_generation()
+
+    def _sync_external_changes(self):
+        """Reload tools if another connection committed since the last check"""
+        with self._lock:
+            version = self._read_data_version()
+            if version == self._data_version:
+                return
+            self._data_version = version
+            count('osint_catalog_external_changes_total', help_text='Writes detected from other connections')
+            if self._loaded_from_db:
+                self.load_tools()
+            else:
+                self._bump_generation()
+
+    def _cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached result for ``key`` or compute and store it"""
+        if self.cache_size <= 0:
+            return compute()
+        with self._lock:
+            self._sync_external_changes()
+            now = time.monotonic()
+            # The tools list identity and length guard against direct edits
+            # of ``self.tools`` that bypassed ``invalidate_cache``.
+            stamp = (self._generation, id(self.tools), len(self.tools))
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] == stamp and entry[1] > now:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+                count('osint_catalog_cache_total', help_text='Catalog query cache lookups', result='hit')
+                return entry[2]
+            self._cache_misses += 1
+            count('osint_catalog_cache_total', help_text='Catalog query cache lookups', result='miss')
+            value = compute()
+            self._cache[key] = (stamp, now + self.cache_ttl, value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+                self._cache_evictions += 1
+            return value
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Query cache hit/miss statistics"""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'evictions': self._cache_evictions,
+            'hit_rate': self._cache_hits / lookups if lookups else 0.0,
+            'size': len(self._cache),
+            'max_size': self.cache_size,
+            'ttl_seconds': self.cache_ttl,
+            'generation': self._generation,
+        }
+
+    @timed(DB_SECONDS, 'Catalog SQLite operation latency', operation='add_tool')
     def add_tool(self, tool: OsintTool) -> bool:
         """Add tool to catalog"""
+        with self._lock:
+            return self._add_tool(tool)
+
+    def _add_tool(self, tool: OsintTool) -> bool:
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = self._conn.cursor()
 
             cursor.execute('''
                 INSERT OR REPLACE INTO tools
                 (name, url, description, category, tags, author, license, language,
                  requires_api_key, requires_install, docker_available, web_interface,
                  is_whitelisted, risk_level, requires_approval, added_date, last_verified,
-                 popularity_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 popularity_score, verification_status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 tool.name, tool.url, tool.description, tool.category.value,
                 json.dumps(tool.tags), tool.author, tool.license, tool.language,
@@ -140,23 +265,65 @@ class OsintCatalog:
                 int(tool.docker_available), int(tool.web_interface),
                 int(tool.is_whitelisted), tool.risk_level,
                 int(tool.requires_approval), tool.added_date, tool.last_verified,
-                tool.popularity_score
+                tool.popularity_score, tool.verification_status
             ))
 
-            conn.commit()
-            conn.close()
+            self._conn.commit()
 
             self.tools.append(tool)
+            self._bump_generation()
             return True
 
         except Exception as e:
-            print(f"Error adding tool: {e}")
+            self._conn.rollback()
+            logger.error("Error adding tool %s: %s", tool.name, e)
+            count('osint_catalog_errors_total', help_text='Failed catalog operations', operation='add_tool')
             return False
 
+    @timed(DB_SECONDS, 'Catalog SQLite operation latency', operation='update_verification')
+    def update_verification(self, updates: Iterable[Tuple[str, str, Optional[str]]]) -> int:
+        """
+        Record URL verification results in one transaction
+
+        ``updates`` yields ``(name, verification_status, last_verified)``
+        tuples; a ``None`` timestamp keeps the previous ``last_verified``.
+        Returns the number of tools updated.
+        """
+        updates = list(updates)
+        if not updates:
+            return 0
+        with self._lock:
+            try:
+                cursor = self._conn.executemany('''
+                    UPDATE tools
+                    SET verification_status = ?, last_verified = COALESCE(?, last_verified)
+                    WHERE name = ?
+                ''', [(status, verified, name) for name, status, verified in updates])
+                self._conn.commit()
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                logger.error("Error updating verification results: %s", e)
+                count('osint_catalog_errors_total', help_text='Failed catalog operations',
+                      operation='update_verification')
+                return 0
+
+            by_name = {name: (status, verified) for name, status, verified in updates}
+            for tool in self.tools:
+                if tool.name in by_name:
+                    status, verified = by_name[tool.name]
+                    tool.verification_status = status
+                    tool.last_verified = verified or tool.last_verified
+            self._bump_generation()
+            return cursor.rowcount
+
+    @timed(DB_SECONDS, 'Catalog SQLite operation latency', operation='load_tools')
     def load_tools(self) -> List[OsintTool]:
         """Load all tools from database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._lock:
+            return self._load_tools()
+
+    def _load_tools(self) -> List[OsintTool]:
+        cursor = self._conn.cursor()
 
         cursor.execute('SELECT * FROM tools')
         rows = cursor.fetchall()
@@ -181,17 +348,27 @@ class OsintCatalog:
                 'requires_approval': bool(row[15]),
                 'added_date': row[16],
                 'last_verified': row[17],
-                'popularity_score': row[18]
+                'popularity_score': row[18],
+                'verification_status': row[19]
             }
             tools.append(OsintTool.from_dict(tool_data))
 
-        conn.close()
         self.tools = tools
+        self._loaded_from_db = True
+        self._data_version = self._read_data_version()
+        self._bump_generation()
+        count('osint_catalog_tools_loaded_total', len(tools), 'Tools loaded from SQLite')
         return tools
 
+    @timed(QUERY_SECONDS, 'Catalog in-memory query latency', query='search')
     def search(self, query: str, category: Optional[ToolCategory] = None) -> List[OsintTool]:
         """Search tools by name, description, or tags"""
         query_lower = query.lower()
+        category = ToolCategory(category) if category else None
+        key = ('search', query_lower, category.value if category else None)
+        return list(self._cached(key, lambda: self._search(query_lower, category)))
+
+    def _search(self, query_lower: str, category: Optional[ToolCategory]) -> List[OsintTool]:
         results = []
 
         for tool in self.tools:
@@ -205,10 +382,14 @@ class OsintCatalog:
 
         return results
 
+    @timed(QUERY_SECONDS, 'Catalog in-memory query latency', query='get_by_category')
     def get_by_category(self, category: ToolCategory) -> List[OsintTool]:
         """Get all tools in a category"""
-        return [tool for tool in self.tools if tool.category == category]
+        category = ToolCategory(category)
+        key = ('get_by_category', category.value)
+        return list(self._cached(key, lambda: [tool for tool in self.tools if tool.category == category]))
 
+    @timed(DB_SECONDS, 'Catalog SQLite operation latency', operation='create_snapshot')
     def create_snapshot(self) -> str:
         """Create a snapshot of current catalog"""
         snapshot_date = datetime.now().isoformat()
@@ -219,16 +400,12 @@ class OsintCatalog:
         }
 
         # Save to database
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO snapshots (snapshot_date, tool_count, data_json)
-            VALUES (?, ?, ?)
-        ''', (snapshot_date, len(self.tools), json.dumps(snapshot_data)))
-
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._conn.execute('''
+                INSERT INTO snapshots (snapshot_date, tool_count, data_json)
+                VALUES (?, ?, ?)
+            ''', (snapshot_date, len(self.tools), json.dumps(snapshot_data)))
+            self._conn.commit()
 
         # Save to file
         snapshot_file = Path(f"osint/registry/snapshots/snapshot_{snapshot_date.replace(':', '').replace('.', '')[:15]}.json")
@@ -251,8 +428,23 @@ class OsintCatalog:
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
+    def to_arrow(self):
+        """Columnar (Arrow) view of the catalog, see ``osint.analytics``"""
+        from .analytics import tools_to_table
+        return tools_to_table(self.tools)
+
+    def export_to_parquet(self, output_path: str) -> str:
+        """Export catalog to a Parquet (``.parquet``) or Arrow IPC file"""
+        from .analytics import export_table
+        return export_table(self.to_arrow(), output_path)
+
+    @timed(QUERY_SECONDS, 'Catalog in-memory query latency', query='get_statistics')
     def get_statistics(self) -> Dict[str, Any]:
         """Get catalog statistics"""
+        stats = self._cached(('get_statistics',), self._compute_statistics)
+        return {**stats, 'by_category': dict(stats['by_category'])}
+
+    def _compute_statistics(self) -> Dict[str, Any]:
         stats = {
             'total_tools': len(self.tools),
             'by_category': {},
@@ -263,7 +455,6 @@ class OsintCatalog:
         }
 
         for category in ToolCategory:
-            count = sum(1 for t in self.tools if t.category == category)
-            stats['by_category'][category.value] = count
+            stats['by_category'][category.value] = sum(1 for t in self.tools if t.category == category)
 
         return stats
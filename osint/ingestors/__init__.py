@@ -1,5 +1,12 @@
 """OSINT Ingestors - Parse and import OSINT tools from various sources"""
 
-from .awesome_osint_parser import AwesomeOsintParser
+from .. import _lazy_exports
+
+_LAZY_ATTRIBUTES = {
+    "AwesomeOsintParser": ".awesome_osint_parser",
+}
 
 __all__ = ["AwesomeOsintParser"]
+
+
+__getattr__, __dir__ = _lazy_exports(globals(), _LAZY_ATTRIBUTES)
@@ -6,11 +6,9 @@ Parses awesome-osint markdown lists and extracts tool information.
 
 import re
 from typing import List, Dict, Optional
-from pathlib import Path
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
 
-from catalog import OsintTool, ToolCategory
+from ..catalog import OsintTool, ToolCategory
+from ..metrics import count, timed
 
 
 class AwesomeOsintParser:
@@ -44,6 +42,7 @@ class AwesomeOsintParser:
         self.markdown_path = markdown_path
         self.tools: List[OsintTool] = []
 
+    @timed('osint_parser_seconds', 'Markdown parse duration', parser='awesome_osint')
     def parse_markdown(self, content: str) -> List[OsintTool]:
         """Parse markdown content and extract tools"""
         tools = []
@@ -63,6 +62,8 @@ class AwesomeOsintParser:
                     tools.append(tool)
 
         self.tools = tools
+        count('osint_parser_lines_total', len(lines), 'Markdown lines parsed', parser='awesome_osint')
+        count('osint_parser_tools_total', len(tools), 'Tools extracted from markdown', parser='awesome_osint')
         return tools
 
     def _parse_tool_line(self, line: str, category: ToolCategory) -> Optional[OsintTool]:
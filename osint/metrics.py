@@ -0,0 +1,280 @@
+"""
+OSINT Metrics
+
+Lightweight, opt-in instrumentation for the catalog, ingestors and runners.
+
+Metrics are disabled by default and every recording helper returns after a
+single flag check, so instrumented code pays almost nothing in production
+unless metrics are switched on with ``OSINT_METRICS=1`` or ``enable()``.
+Collected metrics can be rendered in Prometheus text format or as JSON.
+When ``OSINT_METRICS_FILE`` is set, they are written to that file when the
+process exits (``.json`` files get JSON, anything else Prometheus text).
+"""
+
+import atexit
+import bisect
+import os
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_value(value: float) -> str:
+    """Exact sample value: integers as integers, floats at full precision"""
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    body = ','.join(
+        '{}="{}"'.format(k, v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for k, v in pairs
+    )
+    return '{' + body + '}'
+
+
+class Counter:
+    """Monotonically increasing counter with optional labels"""
+
+    kind = 'counter'
+
+    def __init__(self, name: str, help_text: str = ''):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def to_prometheus(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(key)} {_format_value(value)}")
+        return '\n'.join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': self.kind,
+            'help': self.help,
+            'values': [{'labels': dict(key), 'value': value} for key, value in sorted(self._values.items())],
+        }
+
+
+class Histogram:
+    """Cumulative histogram (Prometheus semantics) with optional labels"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str = '', buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts..., +Inf bucket, sum, count]
+        self._values: Dict[LabelKey, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        self.observe_key(value, _label_key(labels))
+
+    def observe_key(self, value: float, key: LabelKey):
+        """Record ``value`` for an already normalised label key"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def _cumulative(self, state: list) -> list:
+        counts, total = [], 0
+        for bucket_count in state[:len(self.buckets)]:
+            total += bucket_count
+            counts.append(total)
+        return counts
+
+    def to_prometheus(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for key, state in sorted(self._values.items()):
+            for bound, count in zip(self.buckets, self._cumulative(state)):
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', f'{bound:g}'))} {count}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, ('le', '+Inf'))} {state[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {state[-1]}")
+        return '\n'.join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': self.kind,
+            'help': self.help,
+            'buckets': list(self.buckets),
+            'values': [
+                {
+                    'labels': dict(key),
+                    'bucket_counts': self._cumulative(state),
+                    'sum': state[-2],
+                    'count': state[-1],
+                }
+                for key, state in sorted(self._values.items())
+            ],
+        }
+
+
+class _Timer:
+    """Context manager that observes its elapsed time into a histogram"""
+
+    __slots__ = ('_histogram', '_labels', '_start')
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, Any]):
+        self._histogram = histogram
+        self._labels = _label_key(labels)
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._histogram.observe_key(time.perf_counter() - self._start, self._labels)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """Holds all metrics of the process"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name: str, help_text: str, **kwargs):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = cls(name, help_text, **kwargs)
+        return metric
+
+    def counter(self, name: str, help_text: str = '') -> Counter:
+        return self._get(Counter, name, help_text)
+
+    def histogram(self, name: str, help_text: str = '',
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get(Histogram, name, help_text, buckets=buckets)
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+
+    def to_prometheus(self) -> str:
+        return '\n'.join(m.to_prometheus() for _, m in sorted(self._metrics.items())) + '\n'
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: metric.to_dict() for name, metric in sorted(self._metrics.items())}
+
+    def export(self, path: str, fmt: Optional[str] = None):
+        """Write metrics to ``path`` as ``prometheus`` text or ``json``"""
+        fmt = fmt or ('json' if str(path).endswith('.json') else 'prometheus')
+        with open(path, 'w', encoding='utf-8') as f:
+            if fmt == 'json':
+                import json
+                json.dump(self.to_dict(), f, indent=2)
+            else:
+                f.write(self.to_prometheus())
+
+
+REGISTRY = MetricsRegistry(enabled=os.getenv('OSINT_METRICS', '').lower() in ('1', 'true', 'yes'))
+
+
+def enable():
+    """Start recording metrics"""
+    REGISTRY.enabled = True
+
+
+def disable():
+    """Stop recording metrics (already collected values are kept)"""
+    REGISTRY.enabled = False
+
+
+def is_enabled() -> bool:
+    return REGISTRY.enabled
+
+
+def count(name: str, amount: float = 1, help_text: str = '', **labels):
+    """Increment a counter if metrics are enabled"""
+    if REGISTRY.enabled:
+        REGISTRY.counter(name, help_text).inc(amount, **labels)
+
+
+def observe(name: str, value: float, help_text: str = '', **labels):
+    """Record a histogram observation if metrics are enabled"""
+    if REGISTRY.enabled:
+        REGISTRY.histogram(name, help_text).observe(value, **labels)
+
+
+def timer(name: str, help_text: str = '', **labels):
+    """Context manager timing its block into histogram ``name``"""
+    if REGISTRY.enabled:
+        return _Timer(REGISTRY.histogram(name, help_text), labels)
+    return _NULL_TIMER
+
+
+def timed(name: str, help_text: str = '', **labels) -> Callable:
+    """Decorator timing every call of the function into histogram ``name``"""
+    key = _label_key(labels)
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not REGISTRY.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                REGISTRY.histogram(name, help_text).observe_key(time.perf_counter() - start, key)
+        return wrapper
+    return decorator
+
+
+def export_metrics(path: str, fmt: Optional[str] = None):
+    """Write all collected metrics to ``path``"""
+    REGISTRY.export(path, fmt)
+
+
+def _export_at_exit():
+    path = os.getenv('OSINT_METRICS_FILE')
+    if path and REGISTRY.enabled and REGISTRY.to_dict():
+        REGISTRY.export(path)
+
+
+atexit.register(_export_at_exit)
@@ -1,6 +1,14 @@
 """OSINT Tool Runners - Execute OSINT tools safely with policy enforcement"""
 
-from .policy import PolicyEngine, ExecutionPolicy
-from .cli_runner import CLIRunner
+from .. import _lazy_exports
+
+_LAZY_ATTRIBUTES = {
+    "PolicyEngine": ".policy",
+    "ExecutionPolicy": ".policy",
+    "CLIRunner": ".cli_runner",
+}
 
 __all__ = ["PolicyEngine", "ExecutionPolicy", "CLIRunner"]
+
+
+__getattr__, __dir__ = _lazy_exports(globals(), _LAZY_ATTRIBUTES)
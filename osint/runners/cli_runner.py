@@ -4,14 +4,15 @@ CLI Runner - Execute OSINT tools via command line
 Provides safe execution of OSINT tools with policy enforcement.
 """
 
-import subprocess
-import sys
-from pathlib import Path
+import logging
+import time
 from typing import Dict, Any, Optional
-sys.path.append(str(Path(__file__).parent.parent))
 
-from catalog import OsintTool
-from runners.policy import PolicyEngine, get_policy_from_env
+from ..catalog import OsintTool
+from ..metrics import count, observe
+from .policy import PolicyEngine, get_policy_from_env
+
+logger = logging.getLogger(__name__)
 
 
 class CLIRunner:
@@ -26,6 +27,22 @@ class CLIRunner:
 
         Returns execution result with stdout, stderr, returncode
         """
+        start = time.perf_counter()
+        result = self._execute(tool, args)
+        if result.get('success'):
+            outcome = 'success'
+        elif result.get('blocked'):
+            outcome = 'blocked'
+        else:
+            outcome = 'failed'
+        observe('osint_runner_execution_seconds', time.perf_counter() - start,
+                'Tool execution duration', runner='cli', outcome=outcome)
+        count('osint_runner_executions_total', help_text='Tool executions by outcome',
+              runner='cli', outcome=outcome)
+        return result
+
+    def _execute(self, tool: OsintTool, args: list = None) -> Dict[str, Any]:
+        """Run the policy check and dispatch on the tool type"""
 
         # Policy check
         allowed, reason = self.policy.can_execute(
@@ -39,7 +56,8 @@ class CLIRunner:
             return {
                 'success': False,
                 'error': f"Execution blocked by policy: {reason}",
-                'tool': tool.name
+                'tool': tool.name,
+                'blocked': True
             }
 
         # For web-only tools, just return the URL
@@ -74,7 +92,9 @@ class CLIRunner:
             webbrowser.open(url)
             return True
         except Exception as e:
-            print(f"Error opening browser: {e}")
+            logger.error("Error opening browser for %s: %s", url, e)
+            count('osint_runner_errors_total', help_text='Runner failures',
+                  runner='cli', operation='open_in_browser')
             return False
 
 
@@ -83,14 +103,14 @@ def main():
     print("OSINT Lab CLI Runner v1.3.0")
     print("=" * 50)
 
-    from catalog import OsintCatalog
+    from ..catalog import OsintCatalog
 
-    catalog = OsintCatalog()
-    catalog.load_tools()
+    with OsintCatalog() as catalog:
+        tools = catalog.load_tools()
 
-    print(f"Loaded {len(catalog.tools)} tools")
+    print(f"Loaded {len(tools)} tools")
     print("\nExample tools:")
-    for tool in catalog.tools[:5]:
+    for tool in tools[:5]:
         print(f"  - {tool.name} ({tool.category.value})")
 
     print("\nUse the web interface for full functionality")
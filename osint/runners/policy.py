@@ -9,6 +9,8 @@ from enum import Enum
 from typing import List, Optional
 import os
 
+from ..metrics import count
+
 
 class RiskLevel(str, Enum):
     LOW = "low"
@@ -80,6 +82,14 @@ class PolicyEngine:
 
         Returns: (allowed: bool, reason: Optional[str])
         """
+        allowed, reason = self._evaluate(is_whitelisted, risk_level, requires_approval)
+        count('osint_policy_decisions_total', help_text='Policy decisions by outcome',
+              decision='allowed' if allowed else 'denied', reason=reason or '')
+        return allowed, reason
+
+    def _evaluate(self, is_whitelisted: bool, risk_level: str,
+                  requires_approval: bool) -> tuple[bool, Optional[str]]:
+        """Apply the policy rules in order"""
 
         # Check whitelist
         if self.policy.require_whitelist and not is_whitelisted:
@@ -0,0 +1 @@
+"""Tests for the OSINT Lab package"""
@@ -0,0 +1,44 @@
+"""Tests for the columnar catalog analytics"""
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from osint import analytics  # noqa: E402
+from osint.catalog import OsintCatalog, OsintTool, ToolCategory  # noqa: E402
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    with OsintCatalog(str(tmp_path / 'osint.db')) as catalog:
+        for i, category in enumerate(list(ToolCategory) * 3):
+            catalog.add_tool(OsintTool(
+                name=f"tool-{i}",
+                url=f"https://tool-{i}.example.com",
+                description="tool",
+                category=category,
+                tags=['email', 'breach'] if i % 2 else ['dns'],
+                is_whitelisted=i % 3 == 0,
+                docker_available=i % 4 == 0,
+                requires_approval=i % 5 == 0,
+                risk_level='high' if i % 2 else 'low',
+            ))
+        yield catalog
+
+
+def test_summarize_matches_get_statistics(catalog):
+    stats = catalog.get_statistics()
+    summary = analytics.summarize(catalog.to_arrow())
+    assert {key: summary[key] for key in stats} == stats
+    assert summary['by_risk_level'] == {'low': 18, 'high': 18}
+
+
+def test_count_by_tags_with_filter(catalog):
+    rows = analytics.count_by(catalog.to_arrow(), 'tags', where={'risk_level': 'high'})
+    assert {row['tags']: row['count'] for row in rows} == {'email': 18, 'breach': 18}
+
+
+def test_parquet_round_trip(catalog, tmp_path):
+    table = catalog.to_arrow()
+    path = catalog.export_to_parquet(str(tmp_path / 'catalog.parquet'))
+    assert analytics.read_table(path).equals(table)
@@ -0,0 +1,112 @@
+"""Tests for the OsintCatalog query cache"""
+
+import pytest
+
+from osint.catalog import OsintCatalog, OsintTool, ToolCategory
+
+
+def make_tool(name: str, category: ToolCategory = ToolCategory.EMAIL, **kwargs) -> OsintTool:
+    return OsintTool(
+        name=name,
+        url=f"https://{name}.example.com",
+        description=f"{name} lookup tool",
+        category=category,
+        tags=['lookup'],
+        **kwargs
+    )
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'osint.db')
+
+
+@pytest.fixture
+def catalog(db_path):
+    with OsintCatalog(db_path) as catalog:
+        catalog.add_tool(make_tool('hunter'))
+        catalog.add_tool(make_tool('shodan', ToolCategory.DOMAIN_IP))
+        yield catalog
+
+
+def test_repeated_search_is_a_hit(catalog):
+    first = catalog.search('lookup')
+    second = catalog.search('LOOKUP')
+    assert [t.name for t in first] == [t.name for t in second] == ['hunter', 'shodan']
+    stats = catalog.cache_stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+
+
+def test_results_are_copies(catalog):
+    catalog.search('lookup').clear()
+    assert len(catalog.search('lookup')) == 2
+
+
+def test_add_tool_invalidates(catalog):
+    assert len(catalog.get_by_category(ToolCategory.EMAIL)) == 1
+    generation = catalog.cache_stats()['generation']
+    catalog.add_tool(make_tool('holehe'))
+    assert catalog.cache_stats()['generation'] > generation
+    assert [t.name for t in catalog.get_by_category(ToolCategory.EMAIL)] == ['hunter', 'holehe']
+    assert catalog.get_statistics()['by_category']['email'] == 2
+
+
+def test_update_verification_invalidates(catalog):
+    catalog.load_tools()
+    assert catalog.search('hunter')[0].verification_status is None
+    assert catalog.update_verification([('hunter', '200', '2026-01-01T00:00:00+00:00')]) == 1
+    tool = catalog.search('hunter')[0]
+    assert (tool.verification_status, tool.last_verified) == ('200', '2026-01-01T00:00:00+00:00')
+
+
+def test_write_from_other_connection_is_visible(catalog, db_path):
+    catalog.load_tools()
+    assert catalog.get_statistics()['total_tools'] == 2
+    with OsintCatalog(db_path) as other:
+        other.add_tool(make_tool('maigret', ToolCategory.SOCIAL_MEDIA))
+        other.update_verification([('hunter', '404', None)])
+    assert catalog.get_statistics()['total_tools'] == 3
+    assert [t.name for t in catalog.search('maigret')] == ['maigret']
+    assert catalog.search('hunter')[0].verification_status == '404'
+
+
+def test_direct_edit_of_tools_is_detected(catalog):
+    assert len(catalog.search('lookup')) == 2
+    catalog.tools.append(make_tool('sherlock'))
+    assert len(catalog.search('lookup')) == 3
+    catalog.tools = catalog.tools[:1]
+    assert len(catalog.search('lookup')) == 1
+
+
+def test_entries_expire_after_ttl(catalog, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('osint.catalog.time.monotonic', lambda: now[0])
+    catalog.search('lookup')
+    catalog.search('lookup')
+    now[0] += catalog.cache_ttl + 1
+    catalog.search('lookup')
+    stats = catalog.cache_stats()
+    assert (stats['hits'], stats['misses']) == (1, 2)
+
+
+def test_lru_eviction_at_cache_size(db_path):
+    with OsintCatalog(db_path, cache_size=2) as catalog:
+        catalog.add_tool(make_tool('hunter'))
+        catalog.search('a')
+        catalog.search('b')
+        catalog.search('a')  # 'b' is now least recently used
+        catalog.search('c')
+        stats = catalog.cache_stats()
+        assert (stats['size'], stats['evictions']) == (2, 1)
+        catalog.search('a')
+        assert catalog.cache_stats()['hits'] == 2
+        catalog.search('b')
+        assert catalog.cache_stats()['misses'] == 4
+
+
+def test_cache_disabled(db_path):
+    with OsintCatalog(db_path, cache_size=0) as catalog:
+        catalog.add_tool(make_tool('hunter'))
+        catalog.search('hunter')
+        catalog.search('hunter')
+        assert catalog.cache_stats()['size'] == 0
@@ -0,0 +1,86 @@
+"""Tests for the opt-in metrics registry"""
+
+import json
+
+import pytest
+
+from osint import metrics
+
+
+@pytest.fixture
+def registry():
+    enabled = metrics.REGISTRY.enabled
+    metrics.REGISTRY.reset()
+    metrics.enable()
+    yield metrics.REGISTRY
+    metrics.REGISTRY.reset()
+    metrics.REGISTRY.enabled = enabled
+
+
+def test_nothing_recorded_while_disabled(registry):
+    metrics.disable()
+
+    @metrics.timed('test_call_seconds')
+    def call():
+        return 42
+
+    metrics.count('test_total')
+    metrics.observe('test_seconds', 0.5)
+    with metrics.timer('test_block_seconds'):
+        pass
+    assert call() == 42
+    assert registry.to_dict() == {}
+
+
+def test_timed_records_each_call(registry):
+    @metrics.timed('test_call_seconds', 'Call latency', operation='call')
+    def call():
+        return 42
+
+    call()
+    call()
+    [value] = registry.to_dict()['test_call_seconds']['values']
+    assert value['labels'] == {'operation': 'call'}
+    assert value['count'] == 2
+
+
+def test_histogram_buckets_are_cumulative_and_inclusive(registry):
+    histogram = registry.histogram('test_seconds', buckets=(0.1, 1.0, 10.0))
+    for value in (0.05, 0.1, 0.5, 1.0, 20.0):
+        histogram.observe(value)
+    [value] = histogram.to_dict()['values']
+    assert value['bucket_counts'] == [2, 4, 4]
+    assert value['count'] == 5
+    assert value['sum'] == pytest.approx(21.65)
+    text = histogram.to_prometheus()
+    assert 'test_seconds_bucket{le="0.1"} 2' in text
+    assert 'test_seconds_bucket{le="+Inf"} 5' in text
+
+
+def test_prometheus_formatting(registry):
+    metrics.count('test_total', 1234567, 'Big counter', path='a"b\\c\nd')
+    metrics.count('test_ratio_total', 0.1)
+    metrics.observe('test_big_seconds', 1000000)
+    text = registry.to_prometheus()
+    assert '# HELP test_total Big counter' in text
+    assert '# TYPE test_total counter' in text
+    assert 'test_total{path="a\\"b\\\\c\\nd"} 1234567\n' in text
+    assert 'test_ratio_total 0.1\n' in text
+    assert 'test_big_seconds_sum 1000000\n' in text
+
+
+def test_json_export(registry, tmp_path):
+    metrics.count('test_total', 3, 'Counter', kind='a')
+    metrics.observe('test_seconds', 0.2)
+    path = tmp_path / 'metrics.json'
+    metrics.export_metrics(str(path))
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert data['test_total'] == {
+        'type': 'counter', 'help': 'Counter', 'values': [{'labels': {'kind': 'a'}, 'value': 3}],
+    }
+    assert data['test_seconds']['type'] == 'histogram'
+    assert data['test_seconds']['values'][0]['count'] == 1
+
+    prometheus_path = tmp_path / 'metrics.prom'
+    metrics.export_metrics(str(prometheus_path))
+    assert prometheus_path.read_text(encoding='utf-8') == registry.to_prometheus()
@@ -0,0 +1,183 @@
+"""Tests for the URL verifier against a local stub HTTP server"""
+
+import asyncio
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from osint.catalog import OsintCatalog, OsintTool, ToolCategory
+from osint.verifiers.url_verifier import UrlVerifier, verify_catalog
+
+TIMEOUT = 0.5
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """``/ok`` 200, ``/no-head`` 405 on HEAD only, ``/missing`` 404, ``/slow`` hangs"""
+
+    def _respond(self, method: str):
+        self.server.requests.append((method, self.path))
+        path = urlsplit(self.path).path
+        if path == '/slow':
+            time.sleep(TIMEOUT * 4)
+            status = 200
+        elif path == '/no-head':
+            status = 405 if method == 'HEAD' else 200
+        elif path == '/ok':
+            status = 200
+        else:
+            status = 404
+        body = b'stub'
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if method == 'GET':
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self._respond('HEAD')
+
+    def do_GET(self):
+        self._respond('GET')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def stub_server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield httpd
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    with stub_server() as httpd:
+        yield httpd
+
+
+@pytest.fixture
+def base_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+@pytest.fixture
+def refused_url():
+    # Bind and release a port so nothing is listening on it
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+
+def make_verifier(**kwargs) -> UrlVerifier:
+    options = {'concurrency': 8, 'per_host_concurrency': 4, 'per_host_rate': 0, 'timeout': TIMEOUT}
+    options.update(kwargs)
+    return UrlVerifier(**options)
+
+
+def make_tool(name: str, url: str) -> OsintTool:
+    return OsintTool(name=name, url=url, description=name, category=ToolCategory.OTHER, tags=[])
+
+
+def verify(verifier: UrlVerifier, urls):
+    return asyncio.run(verifier.verify_urls(urls))
+
+
+def test_status_classification(server, base_url, refused_url):
+    urls = {
+        'ok': f"{base_url}/ok",
+        'no_head': f"{base_url}/no-head",
+        'missing': f"{base_url}/missing",
+        'slow': f"{base_url}/slow",
+        'refused': refused_url,
+        'ftp': "ftp://127.0.0.1/file",
+    }
+    results = verify(make_verifier(), urls.values())
+    by_name = {name: results[url] for name, url in urls.items()}
+
+    assert (by_name['ok'].status, by_name['ok'].alive, by_name['ok'].method) == ('200', True, 'HEAD')
+    assert (by_name['no_head'].status, by_name['no_head'].alive, by_name['no_head'].method) == ('200', True, 'GET')
+    assert ('HEAD', '/no-head') in server.requests and ('GET', '/no-head') in server.requests
+    assert (by_name['missing'].status, by_name['missing'].alive) == ('404', False)
+    assert (by_name['slow'].status, by_name['slow'].alive) == ('timeout', False)
+    assert (by_name['refused'].status, by_name['refused'].alive) == ('connect_error', False)
+    assert (by_name['ftp'].status, by_name['ftp'].alive) == ('invalid_url', False)
+    assert not any(path == '/file' for _, path in server.requests)
+
+
+def test_duplicate_urls_checked_once(server, base_url):
+    results = verify(make_verifier(), [f"{base_url}/ok"] * 5)
+    assert len(results) == 1
+    assert server.requests == [('HEAD', '/ok')]
+
+
+def test_verifier_reusable_across_runs(server, base_url):
+    verifier = make_verifier(per_host_concurrency=1, per_host_rate=50)
+    urls = [f"{base_url}/ok?{i}" for i in range(6)]
+    for _ in range(2):
+        results = verify(verifier, urls)
+        assert all(result.alive for result in results.values())
+
+
+def test_verify_catalog_persists_results(tmp_path, base_url):
+    db_path = str(tmp_path / 'osint.db')
+    with OsintCatalog(db_path) as catalog:
+        catalog.add_tool(make_tool('alive', f"{base_url}/ok"))
+        catalog.add_tool(make_tool('mirror', f"{base_url}/ok"))
+        catalog.add_tool(make_tool('dead', f"{base_url}/missing"))
+        summary = verify_catalog(catalog, batch_size=1, verifier=make_verifier())
+    assert (summary['urls'], summary['tools'], summary['alive'], summary['dead'], summary['updated']) == (2, 3, 1, 1, 3)
+
+    with OsintCatalog(db_path) as catalog:
+        tools = {tool.name: tool for tool in catalog.load_tools()}
+    assert tools['alive'].verification_status == tools['mirror'].verification_status == '200'
+    assert tools['alive'].last_verified is not None
+    assert tools['dead'].verification_status == '404'
+    assert tools['dead'].last_verified is None
+
+
+def test_malformed_urls_do_not_abort_the_run(base_url):
+    urls = ['http://[invalid/', 'https://a\x00b.com', f"{base_url}/ok"]
+    results = verify(make_verifier(), urls)
+    assert results['http://[invalid/'].status == 'invalid_url'
+    assert results['https://a\x00b.com'].status == 'invalid_url'
+    assert results[f"{base_url}/ok"].alive
+
+
+def test_unexpected_errors_recorded_per_url(base_url, monkeypatch):
+    request = UrlVerifier._request
+
+    async def failing_request(self, client, method, url):
+        if url.endswith('/boom'):
+            raise RuntimeError('boom')
+        return await request(self, client, method, url)
+
+    monkeypatch.setattr(UrlVerifier, '_request', failing_request)
+    results = verify(make_verifier(), [f"{base_url}/boom", f"{base_url}/ok"])
+    assert (results[f"{base_url}/boom"].status, results[f"{base_url}/boom"].error) == ('error', 'boom')
+    assert results[f"{base_url}/ok"].alive
+
+
+def test_dominant_host_does_not_starve_others(base_url):
+    with stub_server() as other:
+        other_url = f"http://127.0.0.1:{other.server_address[1]}"
+        busy = [f"{base_url}/ok?{i}" for i in range(20)]
+        quiet = [f"{other_url}/ok?{i}" for i in range(4)]
+        completed = []
+        verifier = make_verifier(concurrency=4, per_host_concurrency=1, per_host_rate=20)
+        asyncio.run(verifier.verify_urls(busy + quiet, lambda result: completed.append(result.url)))
+    # The rate-limited host is listed first but must not hold every worker
+    assert max(completed.index(url) for url in quiet) < 10
+    assert len(completed) == 24
@@ -0,0 +1,14 @@
+"""OSINT Verifiers - Check catalog tool URLs for liveness"""
+
+from .. import _lazy_exports
+
+_LAZY_ATTRIBUTES = {
+    "UrlVerifier": ".url_verifier",
+    "VerificationResult": ".url_verifier",
+    "verify_catalog": ".url_verifier",
+}
+
+__all__ = ["UrlVerifier", "VerificationResult", "verify_catalog"]
+
+
+__getattr__, __dir__ = _lazy_exports(globals(), _LAZY_ATTRIBUTES)
@@ -0,0 +1,303 @@
+"""
+URL Verifier - Check OSINT tool URLs for liveness
+
+Checks catalog URLs concurrently with asyncio and a pooled httpx client.
+Concurrency is bounded globally and per host, requests to one host are
+rate limited, and servers that reject HEAD are retried with a streamed GET.
+URLs are handed out round-robin over the hosts with a free slot, so a host
+dominating the catalog cannot hold every worker while the others wait.
+Results are written back to the catalog in batches.
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from ..metrics import count, observe
+
+logger = logging.getLogger(__name__)
+
+# HEAD responses that usually mean "HEAD not supported" rather than "dead"
+HEAD_FALLBACK_STATUSES = {400, 403, 405, 406, 501}
+
+# Status codes proving the server and resource exist despite refusing us
+ALIVE_ERROR_STATUSES = {401, 403, 429}
+
+USER_AGENT = "Cyberstreams-OSINT-Verifier/1.3.0"
+
+
+@dataclass
+class VerificationResult:
+    """Outcome of checking one URL"""
+    url: str
+    status: str  # HTTP status code, or error kind such as "timeout"
+    alive: bool
+    checked_at: str
+    elapsed: float = 0.0
+    method: Optional[str] = None
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return asdict(self)
+
+
+def _host_key(url: str) -> str:
+    """Host (with port) a URL is rate limited under; '' if it cannot be parsed"""
+    try:
+        return urlsplit(url).netloc.lower()
+    except ValueError:
+        return ''
+
+
+class UrlVerifier:
+    """Concurrent URL liveness checker"""
+
+    def __init__(self, concurrency: int = 100, per_host_concurrency: int = 4,
+                 per_host_rate: float = 5.0, timeout: float = 10.0,
+                 verify_tls: bool = True, user_agent: str = USER_AGENT):
+        self.concurrency = concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_rate = per_host_rate
+        self.timeout = timeout
+        self.verify_tls = verify_tls
+        self.user_agent = user_agent
+        self._reset_host_state()
+
+    def _reset_host_state(self):
+        """Drop per-host limiter state, which is bound to one event loop"""
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_next_slot: Dict[str, float] = {}
+
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=self.concurrency,
+                                max_keepalive_connections=self.concurrency),
+            timeout=httpx.Timeout(self.timeout),
+            follow_redirects=True,
+            headers={'User-Agent': self.user_agent},
+            verify=self.verify_tls,
+        )
+
+    async def _throttle(self, host: str):
+        """Space out request starts to one host by ``1 / per_host_rate``"""
+        if self.per_host_rate <= 0:
+            return
+        lock = self._host_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            slot = max(now, self._host_next_slot.get(host, now))
+            self._host_next_slot[host] = slot + 1.0 / self.per_host_rate
+            if slot > now:
+                await asyncio.sleep(slot - now)
+
+    async def _request(self, client: httpx.AsyncClient, method: str, url: str) -> int:
+        if method == 'HEAD':
+            response = await client.head(url)
+            return response.status_code
+        # Only the status line is needed; never download the body
+        async with client.stream('GET', url) as response:
+            return response.status_code
+
+    async def check(self, client: httpx.AsyncClient, url: str) -> VerificationResult:
+        """Check one URL, falling back from HEAD to GET when needed"""
+        checked_at = datetime.now(timezone.utc).isoformat()
+        try:
+            parts = urlsplit(url)
+        except ValueError:  # e.g. an unterminated IPv6 literal
+            parts = None
+        if parts is None or parts.scheme not in ('http', 'https') or not parts.netloc:
+            return VerificationResult(url=url, status='invalid_url', alive=False, checked_at=checked_at)
+
+        host = parts.netloc.lower()
+        semaphore = self._host_semaphores.setdefault(host, asyncio.Semaphore(self.per_host_concurrency))
+        start = time.perf_counter()
+        method = 'HEAD'
+        status_code = None
+        error_kind = error = None
+        async with semaphore:
+            for method in ('HEAD', 'GET'):
+                await self._throttle(host)
+                try:
+                    status_code = await self._request(client, method, url)
+                    error_kind = error = None
+                except httpx.InvalidURL as e:
+                    # Not an HTTPError: raised while building the request
+                    status_code, error_kind, error = None, 'invalid_url', str(e)
+                    break
+                except httpx.TimeoutException as e:
+                    status_code, error_kind, error = None, 'timeout', str(e) or 'timeout'
+                    break
+                except httpx.TooManyRedirects as e:
+                    status_code, error_kind, error = None, 'too_many_redirects', str(e)
+                    break
+                except httpx.ConnectError as e:
+                    status_code, error_kind, error = None, 'connect_error', str(e)
+                    break
+                except httpx.HTTPError as e:
+                    # Some servers drop the connection on HEAD; GET may still work
+                    status_code, error_kind, error = None, 'error', str(e)
+                    continue
+                if status_code not in HEAD_FALLBACK_STATUSES:
+                    break
+
+        elapsed = time.perf_counter() - start
+        alive = status_code is not None and (status_code < 400 or status_code in ALIVE_ERROR_STATUSES)
+        observe('osint_verifier_request_seconds', elapsed, 'URL check duration', method=method)
+        count('osint_verifier_checks_total', help_text='URL checks by outcome',
+              outcome='alive' if alive else 'dead')
+        return VerificationResult(
+            url=url,
+            status=str(status_code) if status_code is not None else error_kind,
+            alive=alive,
+            checked_at=checked_at,
+            elapsed=elapsed,
+            method=method,
+            status_code=status_code,
+            error=error,
+        )
+
+    async def verify_urls(self, urls: Iterable[str],
+                          on_result: Optional[Callable[[VerificationResult], None]] = None
+                          ) -> Dict[str, VerificationResult]:
+        """
+        Check ``urls`` with at most ``concurrency`` requests in flight
+
+        Duplicate URLs are checked once.  ``on_result`` is called as each
+        check completes, which lets callers persist results incrementally.
+        A worker is only given a URL whose host is below
+        ``per_host_concurrency``, so at most that many workers ever wait on
+        one host's rate limit.
+        """
+        # Each run may be on a new event loop (``asyncio.run`` per call)
+        self._reset_host_state()
+        per_host = max(1, self.per_host_concurrency)
+        queues: Dict[str, deque] = {}
+        for url in dict.fromkeys(urls):
+            queues.setdefault(_host_key(url), deque()).append(url)
+        # Invariant: a host is in ``ready`` iff it has queued URLs and a free slot
+        ready = deque(queues)
+        active = dict.fromkeys(queues, 0)
+        remaining = sum(len(queue) for queue in queues.values())
+        changed = asyncio.Condition()
+        results: Dict[str, VerificationResult] = {}
+
+        async def next_url() -> Optional[Tuple[str, str]]:
+            nonlocal remaining
+            async with changed:
+                await changed.wait_for(lambda: ready or not remaining)
+                if not ready:
+                    return None
+                host = ready.popleft()
+                url = queues[host].popleft()
+                active[host] += 1
+                remaining -= 1
+                if queues[host] and active[host] < per_host:
+                    ready.append(host)
+                if not remaining:
+                    changed.notify_all()
+                return host, url
+
+        async def release(host: str):
+            async with changed:
+                if queues[host] and active[host] == per_host:
+                    ready.append(host)
+                    changed.notify()
+                active[host] -= 1
+
+        async def worker(client: httpx.AsyncClient):
+            while True:
+                task = await next_url()
+                if task is None:
+                    return
+                host, url = task
+                try:
+                    result = await self.check(client, url)
+                except Exception as e:
+                    # Never let one URL abort the run and lose unflushed results
+                    logger.warning("Unexpected error checking %s: %s", url, e)
+                    result = VerificationResult(url=url, status='error', alive=False,
+                                                checked_at=datetime.now(timezone.utc).isoformat(),
+                                                error=str(e))
+                finally:
+                    await release(host)
+                results[url] = result
+                if on_result:
+                    on_result(result)
+
+        async with self._client() as client:
+            await asyncio.gather(*(worker(client) for _ in range(self.concurrency)))
+        return results
+
+
+def verify_catalog(catalog, batch_size: int = 500, verifier: Optional[UrlVerifier] = None,
+                   tools: Optional[list] = None) -> Dict[str, Any]:
+    """
+    Verify every tool URL in ``catalog`` and write the results back
+
+    ``last_verified`` is set for tools whose URL is alive; the status is
+    recorded for all of them.  Updates are flushed every ``batch_size``
+    results through ``OsintCatalog.update_verification``.
+    """
+    verifier = verifier or UrlVerifier()
+    tools = tools if tools is not None else (catalog.tools or catalog.load_tools())
+    names_by_url: Dict[str, List[str]] = {}
+    for tool in tools:
+        names_by_url.setdefault(tool.url, []).append(tool.name)
+
+    batch = []
+    summary = {'urls': len(names_by_url), 'tools': len(tools), 'alive': 0, 'dead': 0, 'updated': 0}
+
+    def flush():
+        summary['updated'] += catalog.update_verification(batch)
+        batch.clear()
+
+    def on_result(result: VerificationResult):
+        summary['alive' if result.alive else 'dead'] += 1
+        verified = result.checked_at if result.alive else None
+        batch.extend((name, result.status, verified) for name in names_by_url[result.url])
+        if len(batch) >= batch_size:
+            flush()
+
+    start = time.perf_counter()
+    asyncio.run(verifier.verify_urls(names_by_url, on_result))
+    if batch:
+        flush()
+    summary['elapsed'] = time.perf_counter() - start
+    return summary
+
+
+def main():
+    """CLI entry point"""
+    from ..catalog import OsintCatalog
+
+    parser = argparse.ArgumentParser(description="Verify OSINT catalog URLs")
+    parser.add_argument('--db', default='osint/registry/osint.db', help="catalog database path")
+    parser.add_argument('--concurrency', type=int, default=100, help="requests in flight")
+    parser.add_argument('--per-host', type=int, default=4, help="requests in flight per host")
+    parser.add_argument('--rate', type=float, default=5.0, help="request starts per second per host")
+    parser.add_argument('--timeout', type=float, default=10.0, help="per-request timeout in seconds")
+    parser.add_argument('--batch-size', type=int, default=500, help="results per catalog update")
+    args = parser.parse_args()
+
+    verifier = UrlVerifier(concurrency=args.concurrency, per_host_concurrency=args.per_host,
+                           per_host_rate=args.rate, timeout=args.timeout)
+    with OsintCatalog(args.db) as catalog:
+        summary = verify_catalog(catalog, batch_size=args.batch_size, verifier=verifier)
+    print(f"Checked {summary['urls']} URLs for {summary['tools']} tools in {summary['elapsed']:.1f}s")
+    print(f"  alive: {summary['alive']}  dead: {summary['dead']}  updated: {summary['updated']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,523 @@
+"""Reproducible benchmarks for the Python catalog, parser, policy and ML pipelines.
+
+Synthetic inputs are generated deterministically at the requested scales
+(``1k``, ``10k``, ``100k``, ``1M``).  Every benchmark is timed over several
+repeats with a fresh setup, and peak Python memory of one extra run is
+recorded with ``tracemalloc``.  Results are written as JSON; ``--compare``
+checks them against a stored baseline and exits non-zero on regressions.
+
+Usage:
+    python scripts/benchmarks/run_benchmarks.py --scales 1k,10k --output bench.json
+    python scripts/benchmarks/run_benchmarks.py --only catalog --compare baseline.json
+
+The ``metrics`` group compares a bare call with the same call wrapped by
+``osint.metrics.timed`` while metrics are disabled and enabled, which
+bounds the cost instrumentation adds to the hot paths.  ``--metrics`` runs
+the whole suite with instrumentation switched on.  The ``startup`` group
+spawns fresh interpreters to measure cold-start time of the package and of
+the scripts the Node.js server launches; it ignores ``--scales``.
+
+Benchmarks that need optional dependencies (numpy, scikit-learn) are
+skipped with a note when those are not installed.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+for extra_path in (REPO_ROOT, REPO_ROOT / "cyberstreams" / "scripts", REPO_ROOT / "scripts" / "ml"):
+    if str(extra_path) not in sys.path:
+        sys.path.insert(0, str(extra_path))
+
+SCALE_SUFFIXES = {"k": 1_000, "m": 1_000_000}
+DEFAULT_SCALES = "1k,10k"
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.25
+
+WORDS = (
+    "ransomware phishing botnet exploit vulnerability patch advisory malware "
+    "credential leak breach actor campaign infrastructure domain certificate "
+    "email phone geolocation username archive registry darkweb forum market "
+    "scanner crawler search engine dataset intelligence report indicator"
+).split()
+SEARCH_QUERIES = ["ransomware", "email", "api", "search", "domain", "zzz-no-match"]
+
+
+@dataclass
+class Benchmark:
+    """A named benchmark whose ``setup`` returns the callable to measure."""
+
+    name: str
+    group: str
+    setup: Callable[[int, Path], Callable[[], Any]]
+    requires: tuple = ()
+    scaled: bool = True
+
+
+def parse_scale(text: str) -> int:
+    """Parse ``10k`` / ``1M`` / ``2500`` into an integer."""
+    text = text.strip().lower()
+    multiplier = SCALE_SUFFIXES.get(text[-1:], 1)
+    number = text[:-1] if text[-1:] in SCALE_SUFFIXES else text
+    return int(float(number) * multiplier)
+
+
+def format_scale(scale: int) -> str:
+    if scale >= 1_000_000 and scale % 1_000_000 == 0:
+        return f"{scale // 1_000_000}M"
+    if scale >= 1_000 and scale % 1_000 == 0:
+        return f"{scale // 1_000}k"
+    return str(scale)
+
+
+def _sentence(rng: random.Random, length: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+# ---------------------------------------------------------------------------
+
+def synthetic_tools(scale: int, seed: int = 42) -> list:
+    from osint.catalog import OsintTool, ToolCategory
+
+    rng = random.Random(seed)
+    categories = list(ToolCategory)
+    tags = ["free", "api", "opensource", "commercial", "paid", "registration_required"]
+    return [
+        OsintTool(
+            name=f"tool-{i}",
+            url=f"https://tool-{i}.example.com",
+            description=_sentence(rng, 12),
+            category=rng.choice(categories),
+            tags=rng.sample(tags, rng.randint(0, 3)),
+            requires_api_key=rng.random() < 0.3,
+            docker_available=rng.random() < 0.2,
+            is_whitelisted=rng.random() < 0.5,
+            risk_level=rng.choice(["low", "medium", "high"]),
+            requires_approval=rng.random() < 0.4,
+        )
+        for i in range(scale)
+    ]
+
+
+def populate_catalog_db(db_path: Path, tools: list) -> None:
+    """Bulk-insert ``tools`` so read benchmarks do not pay for ``add_tool``."""
+    from osint.catalog import OsintCatalog
+
+    OsintCatalog(str(db_path))
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        """
+        INSERT INTO tools
+        (name, url, description, category, tags, requires_api_key, docker_available,
+         is_whitelisted, risk_level, requires_approval)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (t.name, t.url, t.description, t.category.value, json.dumps(t.tags),
+             int(t.requires_api_key), int(t.docker_available), int(t.is_whitelisted),
+             t.risk_level, int(t.requires_approval))
+            for t in tools
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def synthetic_markdown(scale: int, seed: int = 42) -> str:
+    from osint.ingestors.awesome_osint_parser import AwesomeOsintParser
+
+    rng = random.Random(seed)
+    headers = list(AwesomeOsintParser.CATEGORY_MAPPING) + ["miscellaneous"]
+    lines = ["# Awesome OSINT", ""]
+    for i in range(scale):
+        if i % 50 == 0:
+            lines += ["", f"## {rng.choice(headers).title()}", ""]
+        lines.append(f"* [Tool {i}](https://tool-{i}.example.com) - {_sentence(rng, 10)}")
+    return "\n".join(lines)
+
+
+def synthetic_documents(scale: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    documents = []
+    for i in range(scale):
+        text = (
+            f"Victim: Org {i}\nDate: 2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}\n"
+            f"Description: {_sentence(rng, 25)}. {_sentence(rng, 15)}."
+        )
+        documents.append({"content": text, "source": f"feed-{i % 7}"})
+        if i % 20 == 0:
+            documents.append({"content": text + " Updated.", "source": f"feed-{(i + 1) % 7}"})
+    return documents
+
+
+def synthetic_sequences(scale: int, seed: int = 42) -> list:
+    from pattern_analysis import TtpSequence
+
+    rng = random.Random(seed)
+    return [
+        TtpSequence(
+            actor=f"actor-{i}",
+            timestamps=[float(t) for t in range(4)],
+            vector=[rng.gauss(i % 5, 1.0) for _ in range(16)],
+        )
+        for i in range(scale)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+def setup_catalog_add_tool(scale: int, workdir: Path) -> Callable[[], Any]:
+    from osint.catalog import OsintCatalog
+
+    tools = synthetic_tools(scale)
+    db_path = workdir / f"add-{time.perf_counter_ns()}.db"
+    catalog = OsintCatalog(str(db_path))
+    return lambda: [catalog.add_tool(tool) for tool in tools]
+
+
+def _loaded_catalog(scale: int, workdir: Path):
+    from osint.catalog import OsintCatalog
+
+    db_path = workdir / f"catalog-{scale}.db"
+    if not db_path.exists():
+        populate_catalog_db(db_path, synthetic_tools(scale))
+    catalog = OsintCatalog(str(db_path))
+    catalog.load_tools()
+    return catalog
+
+
+def setup_catalog_load_tools(scale: int, workdir: Path) -> Callable[[], Any]:
+    catalog = _loaded_catalog(scale, workdir)
+    return catalog.load_tools
+
+
+def setup_catalog_search(scale: int, workdir: Path) -> Callable[[], Any]:
+    catalog = _loaded_catalog(scale, workdir)
+    return lambda: [catalog.search(query) for query in SEARCH_QUERIES]
+
+
+def setup_catalog_search_repeat(scale: int, workdir: Path) -> Callable[[], Any]:
+    """The web UI pattern: the same queries issued over and over."""
+    catalog = _loaded_catalog(scale, workdir)
+    return lambda: [catalog.search(query) for _ in range(20) for query in SEARCH_QUERIES]
+
+
+def setup_catalog_statistics(scale: int, workdir: Path) -> Callable[[], Any]:
+    catalog = _loaded_catalog(scale, workdir)
+    return catalog.get_statistics
+
+
+def setup_catalog_snapshot(scale: int, workdir: Path) -> Callable[[], Any]:
+    catalog = _loaded_catalog(scale, workdir)
+    return catalog.create_snapshot
+
+
+def setup_catalog_export_parquet(scale: int, workdir: Path) -> Callable[[], Any]:
+    catalog = _loaded_catalog(scale, workdir)
+    return lambda: catalog.export_to_parquet(str(workdir / f"catalog-{scale}.parquet"))
+
+
+def setup_analytics_summarize(scale: int, workdir: Path) -> Callable[[], Any]:
+    from osint import analytics
+
+    table = _loaded_catalog(scale, workdir).to_arrow()
+    return lambda: analytics.summarize(table)
+
+
+def setup_parse_markdown(scale: int, workdir: Path) -> Callable[[], Any]:
+    from osint.ingestors.awesome_osint_parser import AwesomeOsintParser
+
+    content = synthetic_markdown(scale)
+    parser = AwesomeOsintParser()
+    return lambda: parser.parse_markdown(content)
+
+
+def setup_policy_can_execute(scale: int, workdir: Path) -> Callable[[], Any]:
+    from osint.runners.policy import PERMISSIVE_POLICY, PolicyEngine
+
+    rng = random.Random(42)
+    calls = [
+        (f"tool-{i}", rng.random() < 0.5, rng.choice(["low", "medium", "high", "critical"]),
+         rng.random() < 0.4)
+        for i in range(scale)
+    ]
+    engine = PolicyEngine(PERMISSIVE_POLICY)
+    return lambda: [engine.can_execute(*call) for call in calls]
+
+
+def _metrics_overhead(enabled: Optional[bool]) -> Callable[[int, Path], Callable[[], Any]]:
+    """Call a trivial function ``scale`` times, bare or wrapped by ``metrics.timed``."""
+    def setup(scale: int, workdir: Path) -> Callable[[], Any]:
+        from osint import metrics
+
+        def noop(x):
+            return x
+
+        func = noop if enabled is None else metrics.timed("bench_overhead_seconds")(noop)
+
+        def run():
+            previous = metrics.REGISTRY.enabled
+            metrics.REGISTRY.enabled = bool(enabled)
+            try:
+                for i in range(scale):
+                    func(i)
+            finally:
+                metrics.REGISTRY.enabled = previous
+
+        return run
+
+    return setup
+
+
+def _cold_start(*argv: str) -> Callable[[int, Path], Callable[[], Any]]:
+    """Spawn a fresh interpreter, as the Node.js server does for every request."""
+    def setup(scale: int, workdir: Path) -> Callable[[], Any]:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [str(REPO_ROOT), str(REPO_ROOT / "scripts" / "ml")] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+        )
+        command = [sys.executable, *argv]
+        return lambda: subprocess.run(command, cwd=workdir, env=env, capture_output=True)
+
+    return setup
+
+
+def setup_vector_db_build(scale: int, workdir: Path) -> Callable[[], Any]:
+    import update_vector_db
+
+    input_path = workdir / f"documents-{scale}.json"
+    if not input_path.exists():
+        input_path.write_text(json.dumps(synthetic_documents(scale)), encoding="utf-8")
+    signature_path = workdir / f"signatures-{time.perf_counter_ns()}.minhash"
+    return lambda: update_vector_db.build_vector_db(
+        update_vector_db.iter_json_array(str(input_path)), str(signature_path)
+    )
+
+
+_vector_db_cache: Dict[tuple, dict] = {}
+
+
+def setup_generate_pulse(scale: int, workdir: Path) -> Callable[[], Any]:
+    import generate_pulse
+    import update_vector_db
+
+    key = (str(workdir), scale)
+    if key not in _vector_db_cache:
+        vector_db, _ = update_vector_db.build_vector_db(
+            synthetic_documents(scale), str(workdir / f"pulse-{scale}.minhash")
+        )
+        _vector_db_cache[key] = vector_db
+    vector_db = _vector_db_cache[key]
+
+    def run():
+        ranking = generate_pulse.rank_documents(vector_db)
+        return generate_pulse.summarize_documents(vector_db, [index for index, _ in ranking])
+
+    return run
+
+
+def setup_predict_threat_clusters(scale: int, workdir: Path) -> Callable[[], Any]:
+    from pattern_analysis import predict_threat_clusters
+
+    sequences = synthetic_sequences(scale)
+    return lambda: predict_threat_clusters(sequences)
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("catalog.add_tool", "catalog", setup_catalog_add_tool),
+    Benchmark("catalog.load_tools", "catalog", setup_catalog_load_tools),
+    Benchmark("catalog.search", "catalog", setup_catalog_search),
+    Benchmark("catalog.search_repeat", "catalog", setup_catalog_search_repeat),
+    Benchmark("catalog.get_statistics", "catalog", setup_catalog_statistics),
+    Benchmark("catalog.create_snapshot", "catalog", setup_catalog_snapshot),
+    Benchmark("catalog.export_to_parquet", "catalog", setup_catalog_export_parquet, ("pyarrow",)),
+    Benchmark("analytics.summarize", "analytics", setup_analytics_summarize, ("pyarrow",)),
+    Benchmark("parser.parse_markdown", "parser", setup_parse_markdown),
+    Benchmark("policy.can_execute", "policy", setup_policy_can_execute),
+    Benchmark("metrics.bare_call", "metrics", _metrics_overhead(None)),
+    Benchmark("metrics.timed_disabled", "metrics", _metrics_overhead(False)),
+    Benchmark("metrics.timed_enabled", "metrics", _metrics_overhead(True)),
+    Benchmark("startup.import_osint", "startup", _cold_start("-c", "import osint"), scaled=False),
+    Benchmark("startup.import_osint_runners", "startup",
+              _cold_start("-c", "from osint.runners import CLIRunner"), scaled=False),
+    Benchmark("startup.update_vector_db_help", "startup",
+              _cold_start(str(REPO_ROOT / "cyberstreams" / "scripts" / "update_vector_db.py"), "--help"),
+              scaled=False),
+    Benchmark("startup.generate_pulse_usage", "startup",
+              _cold_start(str(REPO_ROOT / "cyberstreams" / "scripts" / "generate_pulse.py")), scaled=False),
+    Benchmark("startup.import_pattern_analysis", "startup",
+              _cold_start("-c", "import pattern_analysis"), scaled=False),
+    Benchmark("vector.update_vector_db", "vector", setup_vector_db_build, ("numpy", "scipy", "sklearn")),
+    Benchmark("vector.generate_pulse", "vector", setup_generate_pulse, ("numpy", "scipy", "sklearn")),
+    Benchmark("ml.predict_threat_clusters", "ml", setup_predict_threat_clusters, ("numpy", "sklearn")),
+]
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def _missing_modules(modules: tuple) -> List[str]:
+    missing = []
+    for module in modules:
+        try:
+            __import__(module)
+        except ImportError:
+            missing.append(module)
+    return missing
+
+
+def measure(benchmark: Benchmark, scale: int, workdir: Path, repeat: int) -> Dict[str, Any]:
+    """Time ``repeat`` runs with fresh setups, then one traced run for memory."""
+    timings = []
+    for _ in range(repeat):
+        run = benchmark.setup(scale, workdir)
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    run = benchmark.setup(scale, workdir)
+    gc.collect()
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": statistics.median(timings),
+        "min_seconds": min(timings),
+        "runs": timings,
+        "peak_bytes": peak,
+    }
+
+
+def _metrics_enabled() -> bool:
+    from osint import metrics
+
+    return metrics.is_enabled()
+
+
+def run_benchmarks(scales: List[int], repeat: int, only: Optional[List[str]] = None) -> Dict[str, Any]:
+    selected = [
+        b for b in BENCHMARKS
+        if not only or any(b.name == o or b.group == o or b.name.startswith(o + ".") for o in only)
+    ]
+    results: Dict[str, Any] = {}
+    skipped: Dict[str, str] = {}
+    with tempfile.TemporaryDirectory(prefix="cyberstreams-bench-") as tmp:
+        workdir = Path(tmp)
+        previous_cwd = os.getcwd()
+        # create_snapshot writes relative to the working directory.
+        os.chdir(workdir)
+        try:
+            for benchmark in selected:
+                missing = _missing_modules(benchmark.requires)
+                if missing:
+                    skipped[benchmark.name] = f"missing dependencies: {', '.join(missing)}"
+                    print(f"[SKIP] {benchmark.name} ({skipped[benchmark.name]})")
+                    continue
+                for scale in (scales if benchmark.scaled else [1]):
+                    result = measure(benchmark, scale, workdir, repeat)
+                    results.setdefault(benchmark.name, {})[format_scale(scale)] = result
+                    print(f"[OK] {benchmark.name} @ {format_scale(scale)}: "
+                          f"{result['seconds'] * 1000:.2f} ms, peak {result['peak_bytes'] / 1024:.0f} KiB")
+        finally:
+            os.chdir(previous_cwd)
+        _vector_db_cache.clear()
+    return {
+        "meta": {
+            "generated": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeat": repeat,
+            "scales": [format_scale(s) for s in scales],
+            "metrics_enabled": _metrics_enabled(),
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """Return the measurements that regressed by more than ``threshold``."""
+    regressions = []
+    for name, scales in current["results"].items():
+        for scale, result in scales.items():
+            reference = baseline.get("results", {}).get(name, {}).get(scale)
+            if not reference:
+                continue
+            for metric in ("seconds", "peak_bytes"):
+                before, after = reference.get(metric), result.get(metric)
+                if before and after and after > before * (1 + threshold):
+                    regressions.append({
+                        "benchmark": name,
+                        "scale": scale,
+                        "metric": metric,
+                        "baseline": before,
+                        "current": after,
+                        "ratio": after / before,
+                    })
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", default=DEFAULT_SCALES,
+                        help=f"comma-separated input sizes, e.g. 1k,10k,100k,1M (default: {DEFAULT_SCALES})")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"timed runs per benchmark (default: {DEFAULT_REPEAT})")
+    parser.add_argument("--only", help="comma-separated benchmark names or groups to run")
+    parser.add_argument("--output", help="write results JSON to this file")
+    parser.add_argument("--metrics", action="store_true",
+                        help="enable osint.metrics instrumentation while benchmarking")
+    parser.add_argument("--compare", metavar="BASELINE", help="baseline results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"allowed relative slowdown before flagging (default: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args()
+
+    scales = [parse_scale(s) for s in args.scales.split(",") if s.strip()]
+    only = [o.strip() for o in args.only.split(",")] if args.only else None
+    if args.metrics:
+        from osint import metrics
+        metrics.enable()
+    report = run_benchmarks(scales, args.repeat, only)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.threshold)
+        for r in regressions:
+            print(f"[REGRESSION] {r['benchmark']} @ {r['scale']} {r['metric']}: "
+                  f"{r['baseline']:.4g} -> {r['current']:.4g} ({r['ratio']:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions above {args.threshold:.0%} against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
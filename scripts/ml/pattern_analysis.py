@@ -4,11 +4,10 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import TYPE_CHECKING, Iterable, List
 
-import numpy as np
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import StandardScaler
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @dataclass
@@ -34,6 +33,11 @@ def load_sequences(path: Path) -> List[TtpSequence]:
 
 def predict_threat_clusters(sequences: Iterable[TtpSequence], clusters: int = 5) -> np.ndarray:
     """Cluster behavioural vectors and return predicted labels."""
+    # Imported lazily: numpy/scikit-learn dominate the script's start-up time.
+    import numpy as np
+    from sklearn.cluster import KMeans
+    from sklearn.preprocessing import StandardScaler
+
     vectors = np.array([seq.vector for seq in sequences])
     scaler = StandardScaler()
     vectors = scaler.fit_transform(vectors)